@@ -0,0 +1,51 @@
+# tests/test_actions.py
+"""
+Tests for action helpers.
+"""
+
+import pytest
+from uiauto.actions import _SINGLE_CHORD, _STATE_CHECKS
+
+
+class TestSingleChord:
+    """Tests for _SINGLE_CHORD hotkey classification."""
+    
+    @pytest.mark.parametrize("keys", ["^s", "^+{TAB}", "%{F4}", "{ENTER}", "a", "+a", "^{VK_F5}"])
+    def test_single_chord(self, keys):
+        """Should treat one key with optional modifiers as a single chord."""
+        assert _SINGLE_CHORD.fullmatch(keys)
+    
+    @pytest.mark.parametrize("keys", ["{TAB}{TAB}{ENTER}", "^s^c", "hello", "^(ab)", "{TAB 2}", "^", ""])
+    def test_sequence(self, keys):
+        """Should treat multi-key sequences, groups and repeats as sequences."""
+        assert not _SINGLE_CHORD.fullmatch(keys)
+
+
+class _FakeElement:
+    def __init__(self, visible, enabled):
+        self._visible = visible
+        self._enabled = enabled
+    
+    def exists(self):
+        return True
+    
+    def is_visible(self):
+        return self._visible
+    
+    def is_enabled(self):
+        return self._enabled
+
+
+class TestStateChecks:
+    """Tests for the assert_state predicate table."""
+    
+    def test_enabled_requires_visible(self):
+        """Should not report a hidden element as enabled."""
+        predicate, _ = _STATE_CHECKS["enabled"]
+        assert not predicate(_FakeElement(visible=False, enabled=True))
+        assert predicate(_FakeElement(visible=True, enabled=True))
+        assert not predicate(_FakeElement(visible=True, enabled=False))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,160 @@
+# tests/test_cli.py
+"""
+Tests for CLI helpers (scenario discovery and bulk summary output).
+"""
+
+import json
+import os
+
+import pytest
+import uiauto.cli as cli
+from uiauto.cli import (_build_combined_summary, _json_bytes,
+                        _resolve_scenario_paths, _SummaryJsonWriter)
+
+
+def _result(name, status):
+    return {
+        "scenario_path": name,
+        "status": status,
+        "duration_sec": 1.5,
+        "report_path": f"{name}.json",
+        "errors": [],
+    }
+
+
+def _write_summary(path, results, completed=True):
+    writer = _SummaryJsonWriter(str(path))
+    for result in results:
+        writer.add(result)
+    writer.close(completed)
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TestSummaryJsonWriter:
+    """Tests for _SummaryJsonWriter."""
+    
+    def test_matches_combined_summary(self, tmp_path):
+        """Should hold the same document as _build_combined_summary."""
+        results = [_result("a", "passed"), _result("b", "failed"), _result("c", "passed")]
+        summary = _write_summary(tmp_path / "summary.json", results)
+        
+        assert summary == _build_combined_summary(results)
+        assert summary["status"] == "failed"
+        assert summary["passed"] == 2
+        assert summary["failed"] == 1
+    
+    def test_zero_results_is_valid_json(self, tmp_path):
+        """Should write a valid empty summary when no scenario ran."""
+        summary = _write_summary(tmp_path / "summary.json", [])
+        assert summary == _build_combined_summary([])
+    
+    def test_aborted_run_is_not_passed(self, tmp_path):
+        """Should mark an unfinished run as aborted even if nothing failed."""
+        summary = _write_summary(tmp_path / "summary.json", [_result("a", "passed")], completed=False)
+        
+        assert summary["status"] == "aborted"
+        assert summary["total"] == 1
+        assert summary["results"] == [_result("a", "passed")]
+    
+    def test_aborted_run_without_results(self, tmp_path):
+        """Should write valid JSON when aborted before any result."""
+        summary = _write_summary(tmp_path / "summary.json", [], completed=False)
+        assert summary["status"] == "aborted"
+        assert summary["results"] == []
+    
+    def test_creates_parent_directory(self, tmp_path):
+        """Should create missing parent directories."""
+        summary = _write_summary(tmp_path / "out" / "nested" / "summary.json", [_result("a", "passed")])
+        assert summary["status"] == "passed"
+    
+    def test_non_ascii_values(self, tmp_path):
+        """Should round-trip non-ASCII text."""
+        result = _result("scénario", "failed")
+        result["errors"] = ["Fenêtre introuvable"]
+        summary = _write_summary(tmp_path / "summary.json", [result])
+        assert summary["results"] == [result]
+
+
+class TestJsonBytes:
+    """Tests for _json_bytes serialization."""
+    
+    def test_fallback_is_compact(self, monkeypatch):
+        """Should write compact UTF-8 JSON without orjson."""
+        monkeypatch.setattr(cli, "ORJSON_AVAILABLE", False)
+        assert _json_bytes({"a": [1, 2], "b": "é"}) == '{"a":[1,2],"b":"é"}'.encode("utf-8")
+    
+    def test_fallback_writes_non_finite_as_null(self, monkeypatch):
+        """Should write NaN/Infinity as null, keeping the output valid JSON."""
+        monkeypatch.setattr(cli, "ORJSON_AVAILABLE", False)
+        data = _json_bytes({"duration_sec": float("nan"), "values": [float("inf"), 1.5]})
+        assert json.loads(data) == {"duration_sec": None, "values": [None, 1.5]}
+    
+    def test_matches_orjson(self, monkeypatch):
+        """Should produce the same bytes with and without orjson."""
+        orjson = pytest.importorskip("orjson")
+        result = _result("scénario", "failed")
+        result["duration_sec"] = float("nan")
+        monkeypatch.setattr(cli, "ORJSON_AVAILABLE", False)
+        assert _json_bytes(result) == orjson.dumps(result)
+
+
+class TestResolveScenarioPaths:
+    """Tests for _resolve_scenario_paths scenario discovery."""
+    
+    @pytest.fixture
+    def scenarios_dir(self, tmp_path):
+        base = tmp_path / "scenarios"
+        (base / "sub").mkdir(parents=True)
+        (base / "a.yaml").write_text("steps: []\n")
+        (base / "sub" / "b.YML").write_text("steps: []\n")
+        (base / "notes.txt").write_text("not a scenario\n")
+        (base / "elements.yaml").write_text("windows: {}\n")
+        return base
+    
+    def test_finds_yaml_files_recursively(self, scenarios_dir):
+        """Should find *.yaml/*.yml files in all subdirectories, sorted."""
+        paths = _resolve_scenario_paths(None, str(scenarios_dir), None)
+        
+        real = os.path.realpath(scenarios_dir)
+        assert paths == sorted([
+            os.path.join(real, "a.yaml"),
+            os.path.join(real, "elements.yaml"),
+            os.path.join(real, "sub", "b.YML"),
+        ])
+    
+    def test_skips_elements_file(self, scenarios_dir):
+        """Should leave out the elements file when it lives under the directory."""
+        paths = _resolve_scenario_paths(None, str(scenarios_dir), str(scenarios_dir / "elements.yaml"))
+        
+        assert all(os.path.basename(p) != "elements.yaml" for p in paths)
+        assert len(paths) == 2
+    
+    def test_symlinks_do_not_duplicate(self, scenarios_dir):
+        """Should not descend symlinked directories and should dedupe symlinked files."""
+        try:
+            os.symlink(scenarios_dir / "sub", scenarios_dir / "linked_dir", target_is_directory=True)
+            os.symlink(scenarios_dir / "a.yaml", scenarios_dir / "link.yaml")
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported here")
+        
+        paths = _resolve_scenario_paths(None, str(scenarios_dir), str(scenarios_dir / "elements.yaml"))
+        
+        real = os.path.realpath(scenarios_dir)
+        assert paths == sorted([
+            os.path.join(real, "a.yaml"),
+            os.path.join(real, "sub", "b.YML"),
+        ])
+    
+    def test_single_scenario(self, tmp_path):
+        """Should return the single scenario as an absolute path."""
+        paths = _resolve_scenario_paths(str(tmp_path / "one.yaml"), None, None)
+        assert paths == [os.path.abspath(tmp_path / "one.yaml")]
+    
+    def test_missing_directory(self, tmp_path):
+        """Should return no paths for a missing directory."""
+        assert _resolve_scenario_paths(None, str(tmp_path / "missing"), None) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,125 @@
+# tests/test_config.py
+"""
+Tests for timeout configuration.
+"""
+
+import pytest
+from uiauto.config import TimeConfig, TimeoutSettings, build_timeout_overrides
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    """Start and end every test from the process defaults."""
+    TimeConfig.reset_to_defaults()
+    yield
+    TimeConfig.reset_to_defaults()
+
+
+class TestBuildTimeoutOverrides:
+    """Tests for build_timeout_overrides function."""
+    
+    def test_derives_per_field_timeouts(self):
+        """Should scale the base timeout per field."""
+        overrides = build_timeout_overrides(4.0)
+        
+        assert overrides["element_wait"] == {"timeout": 4.0}
+        assert overrides["window_wait"] == {"timeout": 8.0}
+        assert overrides["enabled_wait"] == {"timeout": 2.0}
+        assert overrides["exists_wait"] == {"timeout": 0.8}
+    
+    def test_exists_wait_has_floor(self):
+        """Should not drop exists_wait below 0.1s."""
+        overrides = build_timeout_overrides(0.2)
+        assert overrides["exists_wait"] == {"timeout": 0.1}
+    
+    def test_mapping_is_read_only(self):
+        """Should reject writes so one mapping can be shared across runs."""
+        overrides = build_timeout_overrides(4.0)
+        with pytest.raises(TypeError):
+            overrides["element_wait"] = {"timeout": 1.0}
+    
+    def test_applied_values(self):
+        """Should produce the expected settings when applied to a config."""
+        config = TimeConfig.build_from(overrides=build_timeout_overrides(4.0))
+        base = TimeConfig.default()
+        
+        assert config.element_wait.timeout == 4.0
+        assert config.element_wait.interval == base.element_wait.interval
+        assert config.window_wait.timeout == 8.0
+
+
+class TestApplyOverrides:
+    """Tests for TimeConfig._apply_overrides with shared sub-dicts."""
+    
+    def test_shared_sub_dict_reuses_settings(self):
+        """Should build one TimeoutSettings for fields with equal bases and a shared sub-dict."""
+        config = TimeConfig.default().clone()
+        config.element_wait = TimeoutSettings(timeout=1.0, interval=0.1)
+        config.resolve_element = TimeoutSettings(timeout=1.0, interval=0.1)
+        same = {"timeout": 42.0}
+        config._apply_overrides({"element_wait": same, "resolve_element": same})
+        
+        assert config.element_wait is config.resolve_element
+        assert config.element_wait == TimeoutSettings(timeout=42.0, interval=0.1)
+    
+    def test_shared_sub_dict_keeps_each_base(self):
+        """Should keep each field's own interval when bases differ."""
+        config = TimeConfig.default().clone()
+        config.element_wait = TimeoutSettings(timeout=1.0, interval=0.1)
+        config.window_wait = TimeoutSettings(timeout=2.0, interval=0.5)
+        same = {"timeout": 9.0}
+        config._apply_overrides({"element_wait": same, "window_wait": same})
+        
+        assert config.element_wait == TimeoutSettings(timeout=9.0, interval=0.1)
+        assert config.window_wait == TimeoutSettings(timeout=9.0, interval=0.5)
+    
+    def test_no_op_override_keeps_instance(self):
+        """Should keep the existing settings object when nothing changes."""
+        base = TimeConfig.default()
+        config = TimeConfig.build_from(overrides={"element_wait": {"timeout": base.element_wait.timeout}})
+        assert config.element_wait is base.element_wait
+    
+    def test_unknown_field_raises(self):
+        """Should reject unknown field names."""
+        with pytest.raises(ValueError):
+            TimeConfig.build_from(overrides={"no_such_field": {"timeout": 1.0}})
+
+
+class TestCurrentConfig:
+    """Tests for TimeConfig.current() precedence."""
+    
+    def test_default_is_singleton(self):
+        """Should return the same default instance on every call."""
+        assert TimeConfig.default() is TimeConfig.default()
+    
+    def test_run_config_replaces_default(self):
+        """Should return the installed run config."""
+        run_config = TimeConfig.build_from(overrides={"element_wait": {"timeout": 7.0}})
+        TimeConfig.install_run_config(run_config)
+        
+        assert TimeConfig.current() is run_config
+        TimeConfig.clear_run_config()
+        assert TimeConfig.current() is TimeConfig.default()
+    
+    def test_override_takes_precedence_over_run_config(self):
+        """Should apply an override() block on top of the installed run config."""
+        run_config = TimeConfig.build_from(overrides={"element_wait": {"timeout": 7.0}})
+        TimeConfig.install_run_config(run_config)
+        
+        with TimeConfig.override(element_wait={"timeout": 1.0}) as overridden:
+            assert TimeConfig.current() is overridden
+            assert TimeConfig.current().element_wait.timeout == 1.0
+        
+        assert TimeConfig.current().element_wait.timeout == 7.0
+    
+    def test_run_config_installed_inside_override(self):
+        """Should keep the override active when a run config is installed inside it."""
+        with TimeConfig.override(element_wait={"timeout": 1.0}):
+            TimeConfig.install_run_config(TimeConfig.build_from(overrides={"element_wait": {"timeout": 7.0}}))
+            assert TimeConfig.current().element_wait.timeout == 1.0
+        
+        assert TimeConfig.current().element_wait.timeout == 7.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
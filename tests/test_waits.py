@@ -43,7 +43,22 @@ class TestWaitUntil:
         assert result is True
         assert elapsed >= 0.2  # At least 2 intervals
         assert elapsed < 1.0   # But not too long
-    
+
+    def test_backoff_start_shortens_early_polls(self):
+        """Should poll sooner than interval when backoff_start is given."""
+        start = time.time()
+        counter = {"value": 0}
+
+        def predicate():
+            counter["value"] += 1
+            return counter["value"] >= 3
+
+        result = wait_until(predicate, timeout=5, interval=0.5, backoff_start=0.01)
+        elapsed = time.time() - start
+
+        assert result is True
+        assert elapsed < 0.5  # Two short sleeps instead of two full intervals
+
     def test_timeout_raises_error(self):
         """Should raise TimeoutError when timeout expires."""
         with pytest.raises(TimeoutError) as exc_info:
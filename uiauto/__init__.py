@@ -15,56 +15,61 @@ Quick Start:
 
 __version__ = "1.2.0"
 
-# Core classes
-from .repository import Repository
-from .session import Session
-from .resolver import Resolver
-from .actions import Actions
-from .runner import Runner
-
-# Element classes
-from .element_meta import ElementMeta
-from .resilient import ResilientElement
+# Public names resolve lazily (PEP 562) so importing a submodule such as
+# uiauto.cli does not pull in pywinauto, jsonschema and the runner up front.
+_LAZY_EXPORTS = {
+    # Core classes
+    "Repository": ".repository",
+    "Session": ".session",
+    "Resolver": ".resolver",
+    "Actions": ".actions",
+    "Runner": ".runner",
+    # Element classes
+    "ElementMeta": ".element_meta",
+    "ResilientElement": ".resilient",
+    # Configuration
+    "TimeConfig": ".config",
+    "TimeoutSettings": ".config",
+    "configure_for_ci": ".config",
+    "configure_for_local_dev": ".config",
+    "configure_for_slow": ".config",
+    "available_presets": ".config",
+    # Context tracking
+    "ActionContext": ".context",
+    "ActionContextManager": ".context",
+    "tracked_action": ".context",
+    # Wait utilities
+    "wait_until": ".waits",
+    "wait_until_passes": ".waits",
+    "wait_until_not": ".waits",
+    "wait_for_any": ".waits",
+    "retry": ".waits",
+    # Exceptions
+    "UIAutoError": ".exceptions",
+    "ConfigError": ".exceptions",
+    "TimeoutError": ".exceptions",
+    "WindowNotFoundError": ".exceptions",
+    "ElementNotFoundError": ".exceptions",
+    "ElementNotVisibleError": ".exceptions",
+    "ElementNotEnabledError": ".exceptions",
+    "StaleElementError": ".exceptions",
+    "ActionError": ".exceptions",
+    "LocatorAttempt": ".exceptions",
+}
 
-# Configuration
-from .config import (
-    TimeConfig,
-    TimeoutSettings,
-    configure_for_ci,
-    configure_for_local_dev,
-    configure_for_slow,
-    available_presets,
-)
 
-# Context tracking
-from .context import (
-    ActionContext,
-    ActionContextManager,
-    tracked_action,
-)
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Wait utilities
-from .waits import (
-    wait_until,
-    wait_until_passes,
-    wait_until_not,
-    wait_for_any,
-    retry,
-)
 
-# Exceptions
-from .exceptions import (
-    UIAutoError,
-    ConfigError,
-    TimeoutError,
-    WindowNotFoundError,
-    ElementNotFoundError,
-    ElementNotVisibleError,
-    ElementNotEnabledError,
-    StaleElementError,
-    ActionError,
-    LocatorAttempt,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 __all__ = [
     # Version
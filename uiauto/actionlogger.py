@@ -6,22 +6,29 @@
 from __future__ import annotations
 
 import json
-import os
 import threading
 import time
 import traceback
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+from .logfile import LogFileAppender
+
+# Metadata keys always masked, and actions whose "text" argument is truncated
+_SENSITIVE_KEYS = frozenset({"password", "passwd", "secret", "token"})
+_TEXT_ACTIONS = frozenset({"type", "set_text", "click_and_type"})
+
 
 class ActionLogger:
     """Thread-safe action logger with line/jsonl output."""
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
+        self._local = threading.local()
         self._enabled = False
         self._console = True
         self._file_path: Optional[str] = None
+        self._log_file = LogFileAppender()
         self._level = "INFO"
         self._run_id = "default"
         self._format = "line"
@@ -69,10 +76,9 @@ class ActionLogger:
         return self._enabled
 
     def set_run_id(self, run_id: str) -> None:
-        """Set current run_id."""
+        """Set current run_id (per thread, so concurrent runs keep their own id)."""
         if run_id:
-            with self._lock:
-                self._run_id = run_id
+            self._local.run_id = run_id
 
     def should_log_retry_attempt(self, attempt: int) -> bool:
         """Sampling strategy for retry attempt logs to avoid log spam."""
@@ -100,8 +106,8 @@ class ActionLogger:
             return
 
         timestamp = time.strftime("%H:%M:%S")
-        meta = dict(metadata or {})
-        meta = self._redact_metadata(action, meta)
+        # _redact_metadata builds a new dict, so the caller's metadata is never mutated
+        meta = self._redact_metadata(action, metadata) if metadata else {}
 
         event_obj: Dict[str, Any] = {
             "timestamp": timestamp,
@@ -117,7 +123,7 @@ class ActionLogger:
             "attempt": attempt,
             "duration_ms": duration_ms,
             "metadata": meta,
-            "run_id": self._run_id,
+            "run_id": getattr(self._local, "run_id", None) or self._run_id,
         }
 
         if exception is not None:
@@ -132,12 +138,9 @@ class ActionLogger:
             self._write_file(line)
 
     def _write_file(self, line: str) -> None:
-        try:
-            os.makedirs(os.path.dirname(os.path.abspath(self._file_path)) or ".", exist_ok=True)
-            with open(self._file_path, "a", encoding="utf-8") as f:
-                f.write(line + "\n")
-        except OSError:
-            pass
+        path = self._file_path
+        if path:
+            self._log_file.append(path, line)
 
     def _format_output(self, event: Dict[str, Any]) -> str:
         if self._format == "jsonl":
@@ -201,13 +204,13 @@ class ActionLogger:
         return " | ".join(parts)
 
     def _redact_metadata(self, action: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        sensitive_keys = {"password", "passwd", "secret", "token"}
+        mask_text = action in _TEXT_ACTIONS
         redacted = {}
         for key, value in metadata.items():
-            if key.lower() in sensitive_keys:
+            if key.lower() in _SENSITIVE_KEYS:
                 redacted[key] = "***"
                 continue
-            if action in {"type", "set_text", "click_and_type"} and key == "text":
+            if mask_text and key == "text":
                 redacted[key] = self._mask_text(str(value))
                 continue
             redacted[key] = value
@@ -224,7 +227,8 @@ class ActionLogger:
         if len(tb) > self._max_traceback_chars:
             tb = tb[: self._max_traceback_chars] + "...<truncated>"
 
-        cause = getattr(exception, "__cause__", None)
+        # ActionError suppresses implicit chaining and carries the wrapped error itself
+        cause = getattr(exception, "__cause__", None) or getattr(exception, "cause", None)
         context = getattr(exception, "__context__", None)
 
         return {
@@ -6,15 +6,43 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional
 
 from pywinauto.keyboard import send_keys
 
 from .config import TimeConfig
-from .context import ActionContextManager, tracked_action
-from .exceptions import ActionError
+from .context import tracked_action
+from .exceptions import ActionError, TimeoutError
 from .resolver import Resolver
-from .waits import wait_for_any
+from .waits import wait_for_any, wait_until
+
+# state -> (predicate, failure text) used by Actions.assert_state.
+# is_visible()/is_enabled() already report False for a vanished element, so
+# the exists() probe is dropped; "enabled" still requires a visible element.
+_STATE_CHECKS = {
+    "exists": (lambda el: el.exists(), "not found"),
+    "visible": (lambda el: el.is_visible(), "not visible"),
+    "enabled": (lambda el: el.is_enabled() and el.is_visible(), "not enabled"),
+}
+
+# One key with optional modifiers, e.g. "^s", "^+{TAB}", "%{F4}". send_keys
+# pauses after every key event, which buys nothing inside a single chord.
+_SINGLE_CHORD = re.compile(r"[+^%]*(?:\{\w+\}|[^+^%(){}\s])")
+
+
+def _substring_matcher(substring: str, case_insensitive: bool) -> Callable[[str], bool]:
+    """Return a text -> bool test for substring; the ignore-case pattern is compiled once."""
+    if case_insensitive:
+        pattern = re.compile(re.escape(substring), re.IGNORECASE)
+
+        def matches(text: str) -> bool:
+            return pattern.search(text) is not None
+    else:
+        def matches(text: str) -> bool:
+            return substring in text
+    return matches
 
 
 class Actions:
@@ -40,7 +68,7 @@ class Actions:
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("click", element_name=element, cause=e) from e
+            raise ActionError("click", element_name=element, cause=e) from None
 
     @tracked_action("double_click")
     def double_click(self, element: str, overrides: Optional[Dict[str, Any]] = None) -> None:
@@ -51,7 +79,7 @@ class Actions:
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("double_click", element_name=element, cause=e) from e
+            raise ActionError("double_click", element_name=element, cause=e) from None
 
     @tracked_action("right_click")
     def right_click(self, element: str, overrides: Optional[Dict[str, Any]] = None) -> None:
@@ -62,7 +90,7 @@ class Actions:
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("right_click", element_name=element, cause=e) from e
+            raise ActionError("right_click", element_name=element, cause=e) from None
 
     @tracked_action("hover")
     def hover(self, element: str, overrides: Optional[Dict[str, Any]] = None) -> None:
@@ -73,7 +101,7 @@ class Actions:
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("hover", element_name=element, cause=e) from e
+            raise ActionError("hover", element_name=element, cause=e) from None
 
     @tracked_action("type")
     def type(
@@ -86,11 +114,14 @@ class Actions:
         """Type text into element."""
         try:
             el = self.resolver.resolve(element, overrides=overrides)
-            el.set_text(text, clear_first=clear)
+            if clear:
+                el.replace_text(text)
+            else:
+                el.set_text(text, clear_first=False)
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("type", element_name=element, cause=e) from e
+            raise ActionError("type", element_name=element, cause=e) from None
 
     @tracked_action("click_and_type")
     def click_and_type(
@@ -111,21 +142,19 @@ class Actions:
         @param overrides Optional locator overrides
         @throws ActionError if operation fails
         """
-        with ActionContextManager.action("click_and_type", element_name=element):
-            try:
-                el = self.resolver.resolve(element, overrides=overrides)
-                el.click()
-                
-                # Brief pause to ensure focus
-                import time
-                time.sleep(TimeConfig.current().after_click_pause)
-                
-                el.set_text(text, clear_first=clear)
-                
-            except ActionError:
-                raise
-            except Exception as e:
-                raise ActionError("click_and_type", element_name=element, cause=e) from e
+        try:
+            el = self.resolver.resolve(element, overrides=overrides)
+            el.click()
+            
+            # Brief pause to ensure focus
+            time.sleep(TimeConfig.current().after_click_pause)
+            
+            el.set_text(text, clear_first=clear)
+            
+        except ActionError:
+            raise
+        except Exception as e:
+            raise ActionError("click_and_type", element_name=element, cause=e) from None
 
     @tracked_action("wait_for")
     def wait_for(
@@ -142,7 +171,7 @@ class Actions:
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("wait_for", element_name=element, cause=e) from e
+            raise ActionError("wait_for", element_name=element, cause=e) from None
 
     @tracked_action("wait_for_any")
     def wait_for_any(
@@ -169,8 +198,10 @@ class Actions:
                 descriptions=elements
             )
             return elements[result_index]
+        except ActionError:
+            raise
         except Exception as e:
-            raise ActionError("wait_for_any", details=f"elements={elements}", cause=e) from e
+            raise ActionError("wait_for_any", details=f"elements={elements}", cause=e) from None
 
     @tracked_action("wait_for_gone")
     def wait_for_gone(
@@ -183,7 +214,7 @@ class Actions:
         try:
             self.resolver.wait_for_element_gone(element, timeout=timeout, overrides=overrides)
         except Exception as e:
-            raise ActionError("wait_for_gone", element_name=element, cause=e) from e
+            raise ActionError("wait_for_gone", element_name=element, cause=e) from None
 
     @tracked_action("assert_state")
     def assert_state(
@@ -194,17 +225,17 @@ class Actions:
     ) -> None:
         """Assert element state."""
         try:
+            check = _STATE_CHECKS.get(state)
+            if check is None:
+                raise ValueError(f"Unknown state: {state}. Use 'exists', 'visible', or 'enabled'")
+            predicate, failure = check
             el = self.resolver.resolve(element, overrides=overrides)
-            if state == "exists" and not el.exists():
-                raise AssertionError("Expected exists, but not found")
-            if state == "visible" and not (el.exists() and el.is_visible()):
-                raise AssertionError("Expected visible, but not visible")
-            if state == "enabled" and not (el.exists() and el.is_visible() and el.is_enabled()):
-                raise AssertionError("Expected enabled, but not enabled")
+            if not predicate(el):
+                raise AssertionError(f"Expected {state}, but {failure}")
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("assert_state", element_name=element, cause=e) from e
+            raise ActionError("assert_state", element_name=element, cause=e) from None
 
     @tracked_action("assert_text_equals")
     def assert_text_equals(
@@ -222,25 +253,77 @@ class Actions:
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("assert_text_equals", element_name=element, cause=e) from e
+            raise ActionError("assert_text_equals", element_name=element, cause=e) from None
 
     @tracked_action("assert_text_contains")
     def assert_text_contains(
         self,
         element: str,
         substring: str,
+        case_insensitive: bool = False,
         overrides: Optional[Dict[str, Any]] = None
     ) -> None:
         """Assert element text contains substring."""
         try:
             el = self.resolver.resolve(element, overrides=overrides)
             actual = el.get_text()
-            if substring not in actual:
+            if not _substring_matcher(substring, case_insensitive)(actual):
                 raise AssertionError(f"Expected '{substring}' in '{actual}'")
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("assert_text_contains", element_name=element, cause=e) from e
+            raise ActionError("assert_text_contains", element_name=element, cause=e) from None
+
+    @tracked_action("assert_text_contains_eventually")
+    def assert_text_contains_eventually(
+        self,
+        element: str,
+        substring: str,
+        timeout: Optional[float] = None,
+        case_insensitive: bool = False,
+        overrides: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Poll element text until it contains substring.
+        
+        The element is resolved once; each poll only re-reads its text.
+        
+        @param element Element name from object map
+        @param substring Text expected to appear
+        @param timeout Override timeout (uses element_wait default if None)
+        @param case_insensitive Match substring ignoring case
+        @param overrides Optional locator overrides
+        @throws ActionError if text does not contain substring within timeout
+        """
+        config = TimeConfig.current().element_wait
+        effective_timeout = timeout if timeout is not None else config.timeout
+        matches = _substring_matcher(substring, case_insensitive)
+        observed = ""
+
+        try:
+            el = self.resolver.resolve(element, overrides=overrides)
+
+            def contains() -> bool:
+                nonlocal observed
+                observed = el.get_text()
+                return matches(observed)
+
+            try:
+                wait_until(
+                    contains,
+                    timeout=effective_timeout,
+                    interval=config.interval,
+                    description=f"text of '{element}' to contain '{substring}'",
+                    stage="assert"
+                )
+            except TimeoutError:
+                raise AssertionError(
+                    f"Expected '{substring}' in '{observed}' within {effective_timeout}s"
+                )
+        except ActionError:
+            raise
+        except Exception as e:
+            raise ActionError("assert_text_contains_eventually", element_name=element, cause=e) from None
 
     @tracked_action("close_window")
     def close_window(self, window_name: str) -> None:
@@ -251,16 +334,23 @@ class Actions:
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("close_window", element_name=window_name, cause=e) from e
+            raise ActionError("close_window", element_name=window_name, cause=e) from None
 
     @tracked_action("hotkey")
-    def hotkey(self, keys: str) -> None:
-        """Send global hotkey."""
-        with ActionContextManager.action("hotkey", metadata={"keys": keys}):
-            try:
-                send_keys(keys, pause=TimeConfig.current().hotkey_pause)
-            except Exception as e:
-                raise ActionError("hotkey", details=f"keys={keys}", cause=e) from e
+    def hotkey(self, keys: str, pause: Optional[float] = None) -> None:
+        """
+        Send global hotkey.
+
+        @param keys pywinauto key sequence, e.g. "^s" or "{TAB}{TAB}{ENTER}"
+        @param pause Delay between key events; defaults to 0 for a single chord
+                     and to the configured hotkey_pause for longer sequences
+        """
+        if pause is None:
+            pause = 0.0 if _SINGLE_CHORD.fullmatch(keys) else TimeConfig.current().hotkey_pause
+        try:
+            send_keys(keys, pause=pause)
+        except Exception as e:
+            raise ActionError("hotkey", details=f"keys={keys}", cause=e) from None
 
     @tracked_action("set_checkbox")
     def set_checkbox(
@@ -287,7 +377,7 @@ class Actions:
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("set_checkbox", element_name=element, cause=e) from e
+            raise ActionError("set_checkbox", element_name=element, cause=e) from None
 
     @tracked_action("assert_checkbox_state")
     def assert_checkbox_state(
@@ -306,7 +396,7 @@ class Actions:
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("assert_checkbox_state", element_name=element, cause=e) from e
+            raise ActionError("assert_checkbox_state", element_name=element, cause=e) from None
 
     @tracked_action("select_combobox")
     def select_combobox(
@@ -336,7 +426,6 @@ class Actions:
             # Try 1: If item_element is provided, use click-based selection (QtQuick)
             if item_element:
                 el.click()
-                import time
                 time.sleep(TimeConfig.current().combo_open_pause)
                 item = self.resolver.resolve(item_element, overrides=overrides)
                 item.click()
@@ -351,7 +440,6 @@ class Actions:
                 # Try 3: Fallback - try to find and click a matching ListItem
                 try:
                     el.click()  # Open dropdown
-                    import time
                     time.sleep(TimeConfig.current().combo_open_pause)
                         
                     # Try to find the item by option text
@@ -369,7 +457,7 @@ class Actions:
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("select_combobox", element_name=element, cause=e) from e
+            raise ActionError("select_combobox", element_name=element, cause=e) from None
 
     @tracked_action("select_combobox_item")
     def select_combobox_item(
@@ -390,7 +478,6 @@ class Actions:
             combo = self.resolver.resolve(combobox_element, overrides=overrides)
             combo.click()
             
-            import time
             time.sleep(TimeConfig.current().combo_open_pause)
             
             item = self.resolver.resolve(item_element, overrides=overrides)
@@ -404,7 +491,7 @@ class Actions:
                 "select_combobox_item",
                 element_name=f"{combobox_element} -> {item_element}",
                 cause=e
-            ) from e
+            ) from None
 
     @tracked_action("select_list_item")
     def select_list_item(
@@ -421,7 +508,7 @@ class Actions:
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("select_list_item", element_name=element, cause=e) from e
+            raise ActionError("select_list_item", element_name=element, cause=e) from None
 
     @tracked_action("assert_count")
     def assert_count(
@@ -439,7 +526,7 @@ class Actions:
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("assert_count", element_name=element, cause=e) from e
+            raise ActionError("assert_count", element_name=element, cause=e) from None
     
     # --- New Enhanced Methods ---
     
@@ -452,8 +539,12 @@ class Actions:
     ) -> bool:
         """Click an element if it exists, otherwise continue."""
         effective_timeout = timeout if timeout is not None else TimeConfig.current().exists_wait.timeout
+        if not self.resolver.exists(element, timeout=effective_timeout, overrides=overrides):
+            return False
         try:
-            el = self.resolver.resolve(element, overrides=overrides, timeout=effective_timeout)
+            # exists() leaves the resolved element in the resolver cache
+            el = self.resolver.resolve(element, overrides=overrides, timeout=0)
+            el.wait("enabled", timeout=effective_timeout)
             el.click()
             return True
         except Exception:
@@ -472,7 +563,7 @@ class Actions:
         except ActionError:
             raise
         except Exception as e:
-            raise ActionError("get_text", element_name=element, cause=e) from e
+            raise ActionError("get_text", element_name=element, cause=e) from None
     
     @tracked_action("exists")
     def exists(
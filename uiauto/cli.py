@@ -8,29 +8,34 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
 import os
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
 
 from .actionlogger import ACTION_LOGGER
-from .context import ActionContextManager
-from .inspector import (emit_elements_yaml_stateful, inspect_window,
-                        write_inspect_outputs)
-from .repository import Repository
-from .runner import Runner
+from .config import build_timeout_overrides
+from .context import _TRUTHY
 from .waits import TIMING_LOGGER
 
-# Import recorder conditionally to avoid hard dependency on optional packages
 try:
-    from .recorder import record_session
-    RECORDER_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    RECORDER_AVAILABLE = False
-    record_session = None
+    orjson = None
+    ORJSON_AVAILABLE = False
 
+_DEFAULT_SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "schemas", "scenario.schema.json")
 
-def _resolve_timing_options(args: argparse.Namespace) -> tuple[str, Dict[str, Any]]:
+# Subcommand implementations (repository/runner/inspector/recorder) are imported
+# inside their branches so quick commands don't pay for pywinauto/COM start-up.
+
+
+def _resolve_timing_options(args: argparse.Namespace) -> tuple[str, Mapping[str, Any]]:
     """Resolve deterministic timing preset and CLI overrides without mutating global state."""
     preset = "default"
     if getattr(args, "ci", False):
@@ -40,22 +45,37 @@ def _resolve_timing_options(args: argparse.Namespace) -> tuple[str, Dict[str, An
     elif getattr(args, "slow", False):
         preset = "slow"
 
-    overrides: Dict[str, Any] = {}
+    overrides: Mapping[str, Any] = {}
     timeout = getattr(args, "timeout", None)
     if timeout is not None:
-        overrides = {
-            "element_wait": {"timeout": timeout},
-            "window_wait": {"timeout": timeout * 2},
-            "visibility_wait": {"timeout": timeout},
-            "enabled_wait": {"timeout": timeout / 2},
-            "resolve_window": {"timeout": timeout},
-            "resolve_element": {"timeout": timeout},
-            "wait_for_any": {"timeout": timeout},
-            "exists_wait": {"timeout": max(timeout / 5, 0.1)},
-        }
+        overrides = build_timeout_overrides(timeout)
     return preset, overrides
 
 
+_SCENARIO_SUFFIXES = (".yaml", ".yml")
+
+
+def _iter_scenario_files(base: str) -> Iterator[str]:
+    """
+    Yield real paths of *.yaml/*.yml files under an already-resolved base.
+
+    Symlinked directories are not descended into, so every yielded path is
+    real except for symlinked files; only those pay for os.path.realpath.
+    """
+    pending = [base]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                pending.append(entry.path)
+            elif entry.name.lower().endswith(_SCENARIO_SUFFIXES):
+                yield os.path.realpath(entry.path) if entry.is_symlink() else entry.path
+
+
 def _resolve_scenario_paths(
     single_scenario: Optional[str],
     scenarios_dir: Optional[str],
@@ -71,50 +91,91 @@ def _resolve_scenario_paths(
     if not base.exists() or not base.is_dir():
         return []
 
-    scenario_files = list(base.rglob("*.yaml")) + list(base.rglob("*.yml"))
-    elements_abs = os.path.abspath(elements_path) if elements_path else None
-    unique = sorted({str(path.resolve()) for path in scenario_files})
-    if elements_abs:
-        unique = [path for path in unique if os.path.abspath(path) != elements_abs]
-    return unique
-
+    unique = set(_iter_scenario_files(str(base)))
+    if elements_path:
+        unique.discard(os.path.realpath(elements_path))
+    return sorted(unique)
 
-def _build_report_path(base_report_path: str, scenario_path: str, index: int, bulk_mode: bool) -> str:
-    """Build report path while preserving existing single-scenario behavior."""
-    if not bulk_mode:
-        return base_report_path
 
+def _split_report_path(base_report_path: str) -> tuple[str, str, str]:
+    """Split the base report path once per run; returns (resolved parent, stem, suffix)."""
     base = Path(base_report_path)
-    stem = base.stem
-    suffix = base.suffix or ".json"
-    scenario_stem = Path(scenario_path).stem
-    filename = f"{stem}__{index:03d}_{scenario_stem}{suffix}"
-    return str((base.parent / filename).resolve())
-
-
-def _print_bulk_summary(results: List[Dict[str, Any]]) -> None:
-    """Print compact summary of all scenarios in bulk mode."""
-    print("\nBulk Summary")
-    print("-" * 80)
-    print(f"{'#':<4} {'Status':<8} {'Duration':<10} Scenario (Report)")
-    for idx, result in enumerate(results, start=1):
+    return str(base.parent.resolve()), base.stem, base.suffix or ".json"
+
+
+def _build_report_path(report_base: tuple[str, str, str], scenario_path: str, index: int) -> str:
+    """Build a bulk-mode report path from _split_report_path() components."""
+    parent, stem, suffix = report_base
+    scenario_stem = os.path.splitext(os.path.basename(scenario_path))[0]
+    return os.path.join(parent, f"{stem}__{index:03d}_{scenario_stem}{suffix}")
+
+
+_BAR_EQ = "=" * 60
+_BAR_DASH = "-" * 80
+
+
+def _print_scenario_report(report: Dict[str, Any], scenario_path: str, verbose: bool) -> None:
+    """Print per-scenario summary, step details and errors (text block in a single write)."""
+    lines = [
+        "",
+        _BAR_EQ,
+        f"Scenario: {report.get('scenario', os.path.basename(scenario_path))}",
+        f"Status:   {report.get('status', 'unknown').upper()}",
+        f"Duration: {report.get('duration_sec', 0):.2f}s",
+    ]
+
+    # Step details if verbose or failed
+    if verbose or report.get("status") == "failed":
+        lines.append("\nStep Details:")
+        for step in report.get("steps", []):
+            status_icon = "+" if step["status"] == "passed" else "X"
+            lines.append(f"  {status_icon} [{step['index']}] {step['keyword']}: {step['status']} ({step.get('duration_sec', 0):.2f}s)")
+            if step["status"] == "failed" and "error" in step:
+                lines.append(f"      Error: {step['error']}")
+
+    if report.get("errors"):
+        lines.append("\nErrors:")
+        lines.extend(f"  - {error}" for error in report["errors"])
+
+    lines.append(_BAR_EQ)
+
+    # Also include JSON for machine parsing if verbose
+    if verbose:
+        lines.append("\nFull Report (JSON):")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    if verbose:
+        # Encode straight into stdout rather than building the full string first
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+    # Piped stdout (CI logs) is block-buffered; show each scenario as it finishes
+    sys.stdout.flush()
+
+
+def _print_bulk_summary(summary: Dict[str, Any]) -> None:
+    """Print compact summary of all scenarios in bulk mode from a combined summary."""
+    lines = ["", "Bulk Summary", _BAR_DASH, f"{'#':<4} {'Status':<8} {'Duration':<10} Scenario (Report)"]
+    for idx, result in enumerate(summary["results"], start=1):
         status = str(result.get("status", "unknown")).upper()
         duration = float(result.get("duration_sec", 0))
         scenario_path = str(result.get("scenario_path", ""))
         report_path = str(result.get("report_path", ""))
-        print(f"{idx:<4} {status:<8} {duration:<10.2f} {scenario_path} ({report_path})")
-    summary = _build_combined_summary(results)
-    print("-" * 80)
-    print(
+        lines.append(f"{idx:<4} {status:<8} {duration:<10.2f} {scenario_path} ({report_path})")
+    lines.append(_BAR_DASH)
+    lines.append(
         f"Total: {summary['total']}  Passed: {summary['passed']}  "
         f"Failed: {summary['failed']}  Exit code: {0 if summary['failed'] == 0 else 2}"
     )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _build_combined_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Build machine-readable combined summary."""
-    passed = sum(1 for item in results if item.get("status") == "passed")
-    failed = sum(1 for item in results if item.get("status") != "passed")
+    passed = 0
+    for item in results:
+        if item.get("status") == "passed":
+            passed += 1
+    failed = len(results) - passed
     return {
         "total": len(results),
         "passed": passed,
@@ -124,78 +185,127 @@ def _build_combined_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+def _finite_or_none(obj: Any) -> Any:
+    """Copy obj with NaN/Infinity floats replaced by None, as orjson writes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite_or_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_none(v) for v in obj]
+    return obj
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    # Same bytes as orjson: no spaces after separators, non-finite floats as null
+    try:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    except ValueError:
+        text = json.dumps(_finite_or_none(obj), ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    return text.encode("utf-8")
+
+
+class _SummaryJsonWriter:
+    """
+    Stream the combined bulk summary to disk one scenario result at a time.
+
+    Holds the same keys and values as _build_combined_summary(), but the totals
+    follow the results array and each result is one compact line. A run that
+    stops before every scenario finished is recorded with status "aborted".
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)) or ".", exist_ok=True)
+        self._file = open(path, "wb")
+        self._file.write(b'{\n  "results": [')
+        self._total = 0
+        self._passed = 0
+
+    def add(self, result: Dict[str, Any]) -> None:
+        self._file.write(b",\n    " if self._total else b"\n    ")
+        self._file.write(_json_bytes(result))
+        self._total += 1
+        if result.get("status") == "passed":
+            self._passed += 1
+
+    def close(self, completed: bool) -> None:
+        failed = self._total - self._passed
+        if not completed:
+            status = "aborted"
+        else:
+            status = "passed" if failed == 0 else "failed"
+        totals = {
+            "total": self._total,
+            "passed": self._passed,
+            "failed": failed,
+            "status": status,
+        }
+        self._file.write(b"\n  ],\n" if self._total else b"],\n")
+        self._file.write(b",\n".join(b"  " + _json_bytes(k) + b": " + _json_bytes(v) for k, v in totals.items()))
+        self._file.write(b"\n}\n")
+        self._file.close()
+
+
 def _print_validation_summary(results: List[Dict[str, Any]]) -> None:
     """Print summary for bulk validation."""
-    print("\nValidation Summary")
-    print("-" * 80)
-    print(f"{'#':<4} {'Status':<8} Scenario")
+    lines = ["", "Validation Summary", _BAR_DASH, f"{'#':<4} {'Status':<8} Scenario"]
+    valid = 0
     for idx, result in enumerate(results, start=1):
-        status = str(result.get("status", "unknown")).upper()
+        status = result.get("status", "unknown")
+        if status == "valid":
+            valid += 1
         scenario_path = str(result.get("scenario_path", ""))
-        print(f"{idx:<4} {status:<8} {scenario_path}")
+        lines.append(f"{idx:<4} {str(status).upper():<8} {scenario_path}")
     total = len(results)
-    invalid = sum(1 for item in results if item.get("status") != "valid")
-    valid = total - invalid
-    print("-" * 80)
-    print(f"Total: {total}  Valid: {valid}  Invalid: {invalid}")
+    invalid = total - valid
+    lines.append(_BAR_DASH)
+    lines.append(f"Total: {total}  Valid: {valid}  Invalid: {invalid}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _configure_action_logger_from_env() -> None:
     """Configure action logging from environment variables."""
-    enabled = os.getenv("UIAUTO_ACTION_LOGGING", "").lower() in {"1", "true", "yes", "on"}
-    if not enabled:
+    env = os.environ
+    if env.get("UIAUTO_ACTION_LOGGING", "").lower() not in _TRUTHY:
         ACTION_LOGGER.disable()
         return
 
-    log_file = os.getenv("UIAUTO_ACTION_LOG_FILE")
-    level = os.getenv("UIAUTO_ACTION_LOG_LEVEL", "INFO")
-    fmt = os.getenv("UIAUTO_ACTION_LOG_FORMAT", "line")
-    max_tb_chars = int(os.getenv("UIAUTO_ACTION_LOG_MAX_TRACEBACK", "4000"))
-    sample_retry = int(os.getenv("UIAUTO_ACTION_LOG_SAMPLE_RETRY", "1"))
     ACTION_LOGGER.configure(
         console=True,
-        file_path=log_file,
-        level=level,
-        format=fmt,
-        max_traceback_chars=max_tb_chars,
-        sample_retry_events=sample_retry,
+        file_path=env.get("UIAUTO_ACTION_LOG_FILE"),
+        level=env.get("UIAUTO_ACTION_LOG_LEVEL", "INFO"),
+        format=env.get("UIAUTO_ACTION_LOG_FORMAT", "line"),
+        max_traceback_chars=int(env.get("UIAUTO_ACTION_LOG_MAX_TRACEBACK", "4000")),
+        sample_retry_events=int(env.get("UIAUTO_ACTION_LOG_SAMPLE_RETRY", "1")),
     )
     ACTION_LOGGER.enable()
 
 
 def _configure_timing_logger_from_env() -> None:
     """Configure timing logging from environment variables."""
-    enabled = os.getenv("UIAUTO_TIMING_LOGGING", "").lower() in {"1", "true", "yes", "on"}
-    if not enabled:
+    env = os.environ
+    if env.get("UIAUTO_TIMING_LOGGING", "").lower() not in _TRUTHY:
         TIMING_LOGGER.disable()
         return
 
-    log_file = os.getenv("UIAUTO_TIMING_LOG_FILE")
-    level = os.getenv("UIAUTO_TIMING_LOG_LEVEL", "INFO")
-    TIMING_LOGGER.configure(console=True, file_path=log_file, level=level)
+    TIMING_LOGGER.configure(
+        console=True,
+        file_path=env.get("UIAUTO_TIMING_LOG_FILE"),
+        level=env.get("UIAUTO_TIMING_LOG_LEVEL", "INFO"),
+    )
     TIMING_LOGGER.enable()
 
 
-def main(argv: Optional[List[str]] = None) -> int:
-    """Main entry point for the CLI."""
-    argv = argv or sys.argv[1:]
-    _configure_action_logger_from_env()
-    _configure_timing_logger_from_env()
-
-    p = argparse.ArgumentParser(
-        prog="uiauto",
-        description="cita-uiauto-engine - Windows UI automation framework",
-    )
-    sub = p.add_subparsers(dest="cmd", required=True)
-
-    # -------------------------
-    # run
-    # -------------------------
+def _add_run_parser(sub: argparse._SubParsersAction) -> None:
+    """Add the 'run' subcommand parser."""
     runp = sub.add_parser("run", help="Run a YAML scenario using an elements.yaml object map")
     runp.add_argument("--elements", "-e", required=True, help="Path to elements.yaml (object map)")
     runp.add_argument("--scenario", "-s", required=False, help="Path to scenario.yaml")
     runp.add_argument("--scenarios-dir", default=None, help="Run all scenarios under directory (recursively searches for *.yaml/*.yml)")
-    runp.add_argument("--schema", default=os.path.join(os.path.dirname(__file__), "schemas", "scenario.schema.json"), help="Path to scenario schema JSON")
+    runp.add_argument("--schema", default=_DEFAULT_SCHEMA_PATH, help="Path to scenario schema JSON")
     runp.add_argument("--app", "-a", default=None, help="Optional app path to start (can also use open_app step)")
     runp.add_argument("--vars", default=None, help="Optional vars JSON file")
     runp.add_argument("--var", "-v", action="append", help="Variable in KEY=VALUE format (can be used multiple times)")
@@ -206,10 +316,11 @@ def main(argv: Optional[List[str]] = None) -> int:
     runp.add_argument("--slow", action="store_true", help="Use slow timeout settings for unstable environments")
     runp.add_argument("--verbose", action="store_true", help="Show detailed step output")
     runp.add_argument("--summary-json", default=None, help="Optional output path for combined bulk summary (JSON)")
+    runp.add_argument("--jobs", "-j", type=int, default=1, help="Run up to N scenarios concurrently in bulk mode; only for scenarios driving independent windows (default: 1)")
 
-    # -------------------------
-    # inspect
-    # -------------------------
+
+def _add_inspect_parser(sub: argparse._SubParsersAction) -> None:
+    """Add the 'inspect' subcommand parser."""
     insp = sub.add_parser("inspect", help="Inspect Desktop UIA and dump control candidates (JSON/TXT)")
     insp.add_argument("--window-title-re", default=None, help="Optional: filter visible windows by title regex (best-effort)")
     insp.add_argument("--out", "-o", default="reports", help="Output directory for inspect reports")
@@ -222,9 +333,9 @@ def main(argv: Optional[List[str]] = None) -> int:
     insp.add_argument("--state", default="default", help="UI state name (default: 'default')")
     insp.add_argument("--merge", action="store_true", help="Merge with existing elements.yaml")
 
-    # -------------------------
-    # record
-    # -------------------------
+
+def _add_record_parser(sub: argparse._SubParsersAction) -> None:
+    """Add the 'record' subcommand parser."""
     recp = sub.add_parser("record", help="Record user interactions into semantic YAML steps")
     recp.add_argument("--elements", "-e", required=True, help="Path to elements.yaml (will be updated with new elements)")
     recp.add_argument("--scenario-out", "-s", required=True, help="Output path for recorded scenario YAML")
@@ -233,21 +344,53 @@ def main(argv: Optional[List[str]] = None) -> int:
     recp.add_argument("--state", default="default", help="UI state name for recorded elements (default: 'default')")
     recp.add_argument("--debug-json-out", default=None, help="Optional: save debug snapshots to this JSON file")
 
-    # -------------------------
-    # validate
-    # -------------------------
+
+def _add_validate_parser(sub: argparse._SubParsersAction) -> None:
+    """Add the 'validate' subcommand parser."""
     valp = sub.add_parser("validate", help="Validate configuration files")
     valp.add_argument("--elements", "-e", required=True, help="Path to elements.yaml file")
     valp.add_argument("--scenario", "-s", default=None, help="Path to scenario YAML file (optional)")
     valp.add_argument("--scenarios-dir", default=None, help="Validate all scenarios under directory (recursively searches for *.yaml/*.yml)")
     valp.add_argument("--schema", default=None, help="Path to scenario JSON schema")
 
-    # -------------------------
-    # list-elements
-    # -------------------------
+
+def _add_list_elements_parser(sub: argparse._SubParsersAction) -> None:
+    """Add the 'list-elements' subcommand parser."""
     listp = sub.add_parser("list-elements", help="List all defined windows and elements")
     listp.add_argument("--elements", "-e", required=True, help="Path to elements.yaml file")
 
+
+# Subcommand -> parser builder; main() only builds the one being invoked
+_SUBCOMMAND_PARSERS: Dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "run": _add_run_parser,
+    "inspect": _add_inspect_parser,
+    "record": _add_record_parser,
+    "validate": _add_validate_parser,
+    "list-elements": _add_list_elements_parser,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point for the CLI."""
+    argv = argv or sys.argv[1:]
+    _configure_action_logger_from_env()
+    _configure_timing_logger_from_env()
+
+    p = argparse.ArgumentParser(
+        prog="uiauto",
+        description="cita-uiauto-engine - Windows UI automation framework",
+    )
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    # Only the invoked subcommand's parser is needed; --help and unknown
+    # commands fall back to building all of them.
+    command = argv[0] if argv else None
+    if command in _SUBCOMMAND_PARSERS:
+        _SUBCOMMAND_PARSERS[command](sub)
+    else:
+        for add_parser in _SUBCOMMAND_PARSERS.values():
+            add_parser(sub)
+
     args = p.parse_args(argv)
 
     # -------------------------
@@ -262,11 +405,15 @@ def main(argv: Optional[List[str]] = None) -> int:
             print("Error: one of --scenario or --scenarios-dir is required", file=sys.stderr)
             return 1
 
+        from .context import ActionContextManager
+        from .repository import Repository
+        from .runner import Runner
+
         # Clear any stale action context
         ActionContextManager.clear()
 
         try:
-            repo = Repository(args.elements)
+            repo = Repository.load(args.elements)
         except Exception as e:
             print(f"Error loading elements file: {e}", file=sys.stderr)
             return 1
@@ -277,17 +424,17 @@ def main(argv: Optional[List[str]] = None) -> int:
 
         variables: Dict[str, Any] = {}
         if args.vars:
-            with open(args.vars, "r", encoding="utf-8") as f:
-                variables = json.load(f)
+            # One read of the whole file; json.loads decodes the bytes itself
+            with open(args.vars, "rb") as f:
+                variables = json.loads(f.read())
             if not isinstance(variables, dict):
                 raise ValueError("--vars must be a JSON object mapping")
 
         # Parse inline variables
-        if args.var:
-            for var_spec in args.var:
-                if "=" in var_spec:
-                    key, value = var_spec.split("=", 1)
-                    variables[key.strip()] = value.strip()
+        for var_spec in args.var or ():
+            key, sep, value = var_spec.partition("=")
+            if sep:
+                variables[key.strip()] = value.strip()
 
         scenario_paths = _resolve_scenario_paths(args.scenario, args.scenarios_dir, args.elements)
         if not scenario_paths:
@@ -296,10 +443,24 @@ def main(argv: Optional[List[str]] = None) -> int:
 
         bulk_mode = len(scenario_paths) > 1 or bool(args.scenarios_dir)
         scenario_results: List[Dict[str, Any]] = []
-
-        for idx, scenario_path in enumerate(scenario_paths, start=1):
-            per_report_path = _build_report_path(args.report, scenario_path, idx, bulk_mode)
-            report = runner.run(
+        report_base = _split_report_path(args.report) if bulk_mode else None
+
+        # Each --jobs worker thread builds its own Runner on first use (the compiled
+        # schema validator is shared); action context and run timing config are
+        # already thread-local.
+        runner_local = threading.local()
+        runner_local.runner = runner
+
+        def get_runner() -> Runner:
+            thread_runner = getattr(runner_local, "runner", None)
+            if thread_runner is None:
+                thread_runner = runner_local.runner = Runner(repo, schema_path=args.schema)
+            return thread_runner
+
+        def run_one(idx: int, scenario_path: str) -> tuple[Dict[str, Any], Dict[str, Any]]:
+            # A single scenario keeps writing to --report as given
+            per_report_path = _build_report_path(report_base, scenario_path, idx) if report_base else args.report
+            report = get_runner().run(
                 scenario_path=scenario_path,
                 app_path=args.app,
                 variables=variables,
@@ -307,55 +468,50 @@ def main(argv: Optional[List[str]] = None) -> int:
                 timing_preset=timing_preset,
                 timing_overrides=timing_overrides,
             )
-
-            scenario_results.append({
+            return report, {
                 "scenario_path": scenario_path,
                 "status": report.get("status", "unknown"),
                 "duration_sec": report.get("duration_sec", 0),
                 "report_path": per_report_path,
                 "errors": report.get("errors", []),
-            })
-
-            # Print per-scenario summary
-            print("\n" + "=" * 60)
-            print(f"Scenario: {report.get('scenario', os.path.basename(scenario_path))}")
-            print(f"Status:   {report.get('status', 'unknown').upper()}")
-            print(f"Duration: {report.get('duration_sec', 0):.2f}s")
-
-            # Print step details if verbose or failed
-            if args.verbose or report.get("status") == "failed":
-                print("\nStep Details:")
-                for step in report.get("steps", []):
-                    status_icon = "+" if step["status"] == "passed" else "X"
-                    print(f"  {status_icon} [{step['index']}] {step['keyword']}: {step['status']} ({step.get('duration_sec', 0):.2f}s)")
-                    if step["status"] == "failed" and "error" in step:
-                        print(f"      Error: {step['error']}")
-
-            # Print errors
-            if report.get("errors"):
-                print("\nErrors:")
-                for error in report["errors"]:
-                    print(f"  - {error}")
-
-            print("=" * 60)
-
-            # Also print JSON for machine parsing if verbose
-            if args.verbose:
-                print("\nFull Report (JSON):")
-                print(json.dumps(report, indent=2, ensure_ascii=False))
+            }
 
-        if bulk_mode:
-            _print_bulk_summary(scenario_results)
+        # Opened before any scenario starts, so a bad path fails the run up front
+        summary_writer = _SummaryJsonWriter(args.summary_json) if args.summary_json else None
+        pool: Optional[ThreadPoolExecutor] = None
+        completed = False
+        try:
+            if args.jobs > 1 and len(scenario_paths) > 1:
+                # Scenarios overlap, but reports are still consumed in discovery order
+                pool = ThreadPoolExecutor(max_workers=min(args.jobs, len(scenario_paths)))
+                futures = [pool.submit(run_one, idx, path) for idx, path in enumerate(scenario_paths, start=1)]
+                outcomes = (future.result() for future in futures)
+            else:
+                outcomes = (run_one(idx, path) for idx, path in enumerate(scenario_paths, start=1))
+
+            for scenario_path, (report, result) in zip(scenario_paths, outcomes):
+                scenario_results.append(result)
+                if summary_writer is not None:
+                    summary_writer.add(result)
+                _print_scenario_report(report, scenario_path, args.verbose)
+            completed = True
+        finally:
+            if pool is not None:
+                # On failure or Ctrl-C, drop scenarios that have not started yet
+                pool.shutdown(cancel_futures=True)
+            if summary_writer is not None:
+                summary_writer.close(completed)
 
         combined_summary = _build_combined_summary(scenario_results)
-        if args.summary_json:
-            os.makedirs(os.path.dirname(os.path.abspath(args.summary_json)) or ".", exist_ok=True)
-            with open(args.summary_json, "w", encoding="utf-8") as f:
-                json.dump(combined_summary, f, indent=2, ensure_ascii=False)
+        if bulk_mode:
+            _print_bulk_summary(combined_summary)
 
         return 0 if combined_summary["failed"] == 0 else 2
 
     if args.cmd == "inspect":
+        from .inspector import (emit_elements_yaml_stateful, inspect_window,
+                                write_inspect_outputs)
+
         try:
             result = inspect_window(
                 backend="uia",
@@ -378,26 +534,27 @@ def main(argv: Optional[List[str]] = None) -> int:
                 )
                 paths["elements_yaml"] = out_yaml
 
-            print(json.dumps({
+            json.dump({
                 "status": "ok",
                 "outputs": paths,
                 "controls": len(result.get("controls", [])),
-            }, indent=2, ensure_ascii=False))
+            }, sys.stdout, indent=2, ensure_ascii=False)
+            sys.stdout.write("\n")
             return 0
         except Exception as e:
-            print(json.dumps({
+            json.dump({
                 "status": "error",
                 "error": f"{type(e).__name__}: {e}",
-            }, indent=2), file=sys.stderr)
+            }, sys.stderr, indent=2)
+            sys.stderr.write("\n")
             return 1
 
     if args.cmd == "record":
-        if not RECORDER_AVAILABLE:
-            print("ERROR: Recording requires additional dependencies.", file=sys.stderr)
-            print("Install with: pip install pynput comtypes", file=sys.stderr)
-            return 1
-
+        # Recorder pulls optional packages (pynput, comtypes). A missing package can
+        # surface on import or, since recorder.py guards its own imports, only once
+        # the recorder starts; both report the same install hint.
         try:
+            from .recorder import record_session
             recorder = record_session(
                 elements_yaml=args.elements,
                 scenario_out=args.scenario_out,
@@ -407,6 +564,10 @@ def main(argv: Optional[List[str]] = None) -> int:
                 debug_json_out=args.debug_json_out,
             )
             return 0
+        except ImportError:
+            print("ERROR: Recording requires additional dependencies.", file=sys.stderr)
+            print("Install with: pip install pynput comtypes", file=sys.stderr)
+            return 1
         except KeyboardInterrupt:
             print("\nRecording interrupted by user.")
             return 0
@@ -415,6 +576,9 @@ def main(argv: Optional[List[str]] = None) -> int:
             return 1
 
     if args.cmd == "validate":
+        from .repository import _YAML_LOADER, Repository
+        from .runner import Runner
+
         errors: List[str] = []
 
         if args.scenario and args.scenarios_dir:
@@ -425,7 +589,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             return 1
 
         try:
-            repo = Repository(args.elements)
+            repo = Repository.load(args.elements)
             print(f"+ Elements file is valid: {args.elements}")
             print(f"  - Windows: {len(repo.list_windows())}")
             print(f"  - Elements: {len(repo.list_elements())}")
@@ -441,9 +605,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         validation_results: List[Dict[str, Any]] = []
         try:
             import yaml as yaml_lib
-            schema_path = args.schema or os.path.join(
-                os.path.dirname(__file__), "schemas", "scenario.schema.json"
-            )
+            schema_path = args.schema or _DEFAULT_SCHEMA_PATH
             runner = Runner(repo, schema_path=schema_path)
         except Exception as e:
             errors.append(f"Scenario validation setup failed: {e}")
@@ -452,8 +614,8 @@ def main(argv: Optional[List[str]] = None) -> int:
 
         for scenario_path in scenario_paths:
             try:
-                with open(scenario_path, "r", encoding="utf-8") as f:
-                    scenario = yaml_lib.safe_load(f)
+                with open(scenario_path, "rb") as f:
+                    scenario = yaml_lib.load(f, Loader=_YAML_LOADER)
                 runner.validate(scenario)
                 steps_count = len(scenario.get("steps", [])) if isinstance(scenario, dict) else 0
                 print(f"+ Scenario file is valid: {scenario_path}")
@@ -478,33 +640,30 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 2 if errors else 0
 
     if args.cmd == "list-elements":
+        from .repository import Repository
+
         try:
-            repo = Repository(args.elements)
+            repo = Repository.load(args.elements)
         except Exception as e:
             print(f"Error loading elements file: {e}", file=sys.stderr)
             return 1
 
         windows = repo.list_windows()
-        print(f"Windows ({len(windows)}):")
-        for name in windows:
-            print(f"  - {name}")
-
-        elements = repo.list_elements()
-        print(f"\nElements ({len(elements)}):")
+        lines = [f"Windows ({len(windows)}):"]
+        lines.extend(f"  - {name}" for name in windows)
 
-        by_window: Dict[str, List[str]] = {}
-        for name in elements:
-            spec = repo.get_element_spec(name)
-            window = spec.get("window", "unknown")
-            if window not in by_window:
-                by_window[window] = []
-            by_window[window].append(name)
+        by_window: Dict[str, List[str]] = defaultdict(list)
+        count = 0
+        for name, spec in repo.iter_element_specs():
+            by_window[spec.get("window", "unknown")].append(name)
+            count += 1
+        lines.append(f"\nElements ({count}):")
 
         for window, elem_names in by_window.items():
-            print(f"\n  [{window}]")
-            for name in elem_names:
-                print(f"    - {name}")
+            lines.append(f"\n  [{window}]")
+            lines.extend(f"    - {name}" for name in elem_names)
 
+        sys.stdout.write("\n".join(lines) + "\n")
         return 0
 
     return 1
@@ -8,17 +8,28 @@ from __future__ import annotations
 
 import threading
 from contextlib import contextmanager
-from copy import deepcopy
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any, Dict, Generator, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Generator, Mapping, Optional, Tuple
 
-from .timings import (PAUSE_FIELDS, TIMEOUT_FIELDS, build_preset_values,
-                      list_presets)
+# The preset tables in .timings are imported on first use rather than with this
+# module, so CLI paths that never build a TimeConfig don't load them.
+_TIMINGS_EXPORTS = frozenset({"PAUSE_FIELDS", "TIMEOUT_FIELDS", "build_preset_values", "list_presets"})
 
 
-@dataclass
+def __getattr__(name: str) -> Any:
+    if name in _TIMINGS_EXPORTS:
+        from . import timings
+        value = getattr(timings, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@dataclass(frozen=True, slots=True)
 class TimeoutSettings:
-    """Individual timeout settings for a specific operation type."""
+    """Individual timeout settings for a specific operation type (immutable, safe to share)."""
     timeout: float
     interval: float
     retry_count: Optional[int] = None
@@ -29,7 +40,13 @@ class TimeoutSettings:
         interval: Optional[float] = None,
         retry_count: Optional[int] = None,
     ) -> TimeoutSettings:
-        """Create a new settings instance with overrides applied."""
+        """Create a new settings instance with overrides applied (self if nothing changes)."""
+        if (
+            (timeout is None or timeout == self.timeout)
+            and (interval is None or interval == self.interval)
+            and (retry_count is None or retry_count == self.retry_count)
+        ):
+            return self
         return TimeoutSettings(
             timeout=timeout if timeout is not None else self.timeout,
             interval=interval if interval is not None else self.interval,
@@ -47,26 +64,75 @@ class TimeConfig:
 
     _default_instance: Optional[TimeConfig] = None
     _default_preset: str = "default"
-    _local = threading.local()
+    # Per-thread (and per-asyncio-task) config state; pool threads start empty
+    _run_config_var: ContextVar[Optional[TimeConfig]] = ContextVar("uiauto_run_config", default=None)
+    _override_var: ContextVar[Optional[TimeConfig]] = ContextVar("uiauto_override", default=None)
+    # override if set, else run config; kept in step so current() is a single read
+    _effective_var: ContextVar[Optional[TimeConfig]] = ContextVar("uiauto_effective", default=None)
     _lock = threading.Lock()
+    # action name -> per-action TimeoutSettings field; other actions use action_timeout.
+    # Every target is a timings.TIMEOUT_FIELDS entry, so it is set on every instance.
+    _ACTION_FIELD_MAP: Dict[str, str] = {
+        "click": "click_action",
+        "double_click": "double_click_action",
+        "right_click": "right_click_action",
+        "hover": "hover_action",
+        "set_text": "set_text_action",
+        "get_text": "get_text_action",
+        "check": "check_action",
+        "uncheck": "uncheck_action",
+        "select": "select_action",
+        "select_item": "select_item_action",
+        "key_send": "key_send_action",
+    }
+    # (timeout field names, pause field names), filled on first use from .timings
+    _FIELD_NAMES: Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]] = None
+    # preset name -> coerced {field: TimeoutSettings | float}; values are immutable
+    _preset_cache: Dict[str, Dict[str, Any]] = {}
     
     def __init__(self, preset: Optional[str] = None):
         preset_name = preset or self._default_preset
-        self._apply_values(build_preset_values(preset_name))
+        for name, value in self._preset_values(preset_name).items():
+            setattr(self, name, value)
+
+    @classmethod
+    def _preset_values(cls, preset: str) -> Dict[str, Any]:
+        """Coerced attribute values for a preset, built once per preset name."""
+        # Same normalisation as build_preset_values, so "CI" and "ci" share an entry
+        key = (preset or "default").lower()
+        cached = cls._preset_cache.get(key)
+        if cached is None:
+            from .timings import build_preset_values
+            cached = cls._coerce_values(build_preset_values(key))
+            cls._preset_cache[key] = cached
+        return cached
 
     @classmethod
     def _timeout_fields(cls) -> Dict[str, Dict[str, Any]]:
+        from .timings import TIMEOUT_FIELDS
         return TIMEOUT_FIELDS
 
     @classmethod
     def _pause_fields(cls) -> Dict[str, float]:
+        from .timings import PAUSE_FIELDS
         return PAUSE_FIELDS
 
-    def _apply_values(self, values: Dict[str, Any]) -> None:
-        for name in self._timeout_fields():
+    @classmethod
+    def _field_names(cls) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        names = TimeConfig._FIELD_NAMES
+        if names is None:
+            from .timings import PAUSE_FIELDS, TIMEOUT_FIELDS
+            names = TimeConfig._FIELD_NAMES = (tuple(TIMEOUT_FIELDS), tuple(PAUSE_FIELDS))
+        return names
+
+    @classmethod
+    def _coerce_values(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        timeout_names, pause_names = cls._field_names()
+        coerced: Dict[str, Any] = {}
+        for name in timeout_names:
             val = values.get(name)
             if isinstance(val, TimeoutSettings):
-                setting = deepcopy(val)
+                setting = val
             elif isinstance(val, dict):
                 setting = TimeoutSettings(
                     timeout=float(val["timeout"]),
@@ -75,53 +141,69 @@ class TimeConfig:
                 )
             else:
                 raise ValueError(f"Invalid timeout setting for {name}: {val}")
-            setattr(self, name, setting)
+            coerced[name] = setting
 
-        for name in self._pause_fields():
+        for name in pause_names:
             if name not in values:
                 raise ValueError(f"Missing pause setting for {name}")
-            setattr(self, name, float(values[name]))
+            coerced[name] = float(values[name])
+        return coerced
+
+    def _apply_overrides(self, overrides: Mapping[str, Any]) -> None:
+        """Apply {field: dict | TimeoutSettings | float} overrides in place."""
+        timeout_fields = self._timeout_fields()
+        pause_fields = self._pause_fields()
+        # Override builders share one sub-dict across fields, and many fields start
+        # from equal settings, so each (base, sub-dict) pair is resolved only once
+        resolved: Dict[Tuple[TimeoutSettings, int], TimeoutSettings] = {}
+        for key, value in overrides.items():
+            if key in timeout_fields:
+                if isinstance(value, TimeoutSettings):
+                    setattr(self, key, value)
+                elif isinstance(value, dict):
+                    base_setting: TimeoutSettings = getattr(self, key)
+                    memo_key = (base_setting, id(value))
+                    setting = resolved.get(memo_key)
+                    if setting is None:
+                        setting = resolved[memo_key] = base_setting.with_overrides(
+                            timeout=value.get("timeout"),
+                            interval=value.get("interval"),
+                            retry_count=value.get("retry_count"),
+                        )
+                    setattr(self, key, setting)
+                else:
+                    raise ValueError(f"Invalid override for {key}: {value}")
+            elif key in pause_fields:
+                setattr(self, key, float(value))
+            else:
+                raise ValueError(f"Unknown TimeConfig field: {key}")
 
     def to_dict(self) -> Dict[str, Any]:
+        timeout_names, pause_names = self._field_names()
         data: Dict[str, Any] = {}
-        for name in self._timeout_fields():
+        for name in timeout_names:
             setting: TimeoutSettings = getattr(self, name)
             data[name] = {
                 "timeout": setting.timeout,
                 "interval": setting.interval,
                 "retry_count": setting.retry_count,
             }
-        for name in self._pause_fields():
+        for name in pause_names:
             data[name] = getattr(self, name)
         return data
 
     def clone(self) -> TimeConfig:
-        """Return a deep clone of this config."""
-        clone = TimeConfig()
-        clone._apply_values(self.to_dict())
+        """Return an independent copy of this config (settings are immutable and shared)."""
+        clone = TimeConfig.__new__(TimeConfig)
+        # Instance state is exactly the timeout/pause fields, so one dict copy suffices
+        clone.__dict__.update(self.__dict__)
         return clone
 
     def _clone(self) -> TimeConfig:
         return self.clone()
 
     def get_action_settings(self, action_name: str) -> TimeoutSettings:
-        mapping = {
-            "click": "click_action",
-            "double_click": "double_click_action",
-            "right_click": "right_click_action",
-            "hover": "hover_action",
-            "set_text": "set_text_action",
-            "get_text": "get_text_action",
-            "check": "check_action",
-            "uncheck": "uncheck_action",
-            "select": "select_action",
-            "select_item": "select_item_action",
-            "key_send": "key_send_action",
-        }
-        field = mapping.get(action_name)
-        if field and hasattr(self, field):
-            return getattr(self, field)
-        return self.action_timeout
+        return getattr(self, self._ACTION_FIELD_MAP.get(action_name, "action_timeout"))
         
     @classmethod
     def build_from(
@@ -134,123 +216,104 @@ class TimeConfig:
         """Build a deterministic run-scope config snapshot."""
         cfg = cls(preset)
         if overrides:
-            _apply_overrides(cfg, overrides)
+            cfg._apply_overrides(overrides)
         if app_defaults and preset == "default":
-            default_timeout = float(app_defaults["default_timeout"])
-            polling_interval = float(app_defaults["polling_interval"])
-            _apply_overrides(
-                cfg,
-                {
-                    "element_wait": {"timeout": default_timeout, "interval": polling_interval},
-                    "visibility_wait": {"timeout": default_timeout, "interval": polling_interval},
-                    "enabled_wait": {"timeout": default_timeout, "interval": polling_interval},
-                    "resolve_window": {"timeout": default_timeout, "interval": polling_interval},
-                    "resolve_element": {"timeout": default_timeout, "interval": polling_interval},
-                    "wait_for_any": {"timeout": default_timeout, "interval": polling_interval},
-                    "exists_wait": {
-                        "timeout": max(default_timeout / 5, polling_interval),
-                        "interval": polling_interval,
-                    },
-                },
+            cfg._apply_overrides(
+                _build_app_default_overrides(
+                    float(app_defaults["default_timeout"]),
+                    float(app_defaults["polling_interval"]),
+                ),
             )
         return cfg
 
     @classmethod
     def default(cls) -> TimeConfig:
         """Get the immutable process default configuration (singleton)."""
-        if cls._default_instance is None:
+        # Built on first use so importing this module doesn't load .timings
+        instance = cls._default_instance
+        if instance is None:
             with cls._lock:
-                if cls._default_instance is None:
-                    cls._default_instance = cls(cls._default_preset)
-        return cls._default_instance
+                instance = cls._default_instance
+                if instance is None:
+                    instance = cls._default_instance = cls(cls._default_preset)
+        return instance
     
     @classmethod
     def install_run_config(cls, config: TimeConfig) -> None:
         """Install per-thread run configuration snapshot."""
-        cls._local.run_config = config
+        cls._run_config_var.set(config)
+        cls._refresh_effective()
 
     @classmethod
     def clear_run_config(cls) -> None:
         """Clear per-thread run configuration snapshot."""
-        cls._local.run_config = None
+        cls._run_config_var.set(None)
+        cls._refresh_effective()
 
     @classmethod
-    def current(cls) -> TimeConfig:
-        """Get the current effective configuration."""
-        run_cfg = getattr(cls._local, "run_config", None)
-        if run_cfg is not None:
-            return run_cfg
-
-        override = getattr(cls._local, "override", None)
-        if override is not None:
-            return override
+    def _refresh_effective(cls) -> None:
+        override = cls._override_var.get()
+        cls._effective_var.set(override if override is not None else cls._run_config_var.get())
 
+    @classmethod
+    def current(cls) -> TimeConfig:
+        """Get the current effective configuration (override, then run config, then default)."""
+        effective = cls._effective_var.get()
+        if effective is not None:
+            return effective
         return cls.default()
     
     @classmethod
     def apply_preset(cls, preset: str) -> None:
         """Backward-compatible API: apply preset to current run-scope config."""
         base = cls.current().clone()
-        base._apply_values(build_preset_values(preset))
+        for name, value in cls._preset_values(preset).items():
+            setattr(base, name, value)
         cls.install_run_config(base)
 
     @classmethod
     def apply_overrides(cls, overrides: Dict[str, Any]) -> None:
         """Backward-compatible API: apply overrides to current run-scope config."""
         config = cls.current().clone()
-        _apply_overrides(config, overrides)
+        config._apply_overrides(overrides)
         cls.install_run_config(config)
 
     @classmethod
     def apply_timeout_override(cls, timeout: float) -> None:
         """Backward-compatible API: override base timeout values for run-scope config."""
         config = cls.current().clone()
-        base_overrides: Dict[str, Any] = {
-            "element_wait": {"timeout": timeout},
-            "window_wait": {"timeout": timeout * 2},
-            "visibility_wait": {"timeout": timeout},
-            "enabled_wait": {"timeout": timeout / 2},
-            "resolve_window": {"timeout": timeout},
-            "resolve_element": {"timeout": timeout},
-            "wait_for_any": {"timeout": timeout},
-            "exists_wait": {"timeout": max(timeout / 5, 0.1)},
-        }
-        _apply_overrides(config, base_overrides)
+        config._apply_overrides(build_timeout_overrides(timeout))
         cls.install_run_config(config)
 
     @classmethod
     def apply_app_defaults(cls, default_timeout: float, polling_interval: float) -> None:
         """Backward-compatible API: apply app defaults to run-scope config."""
         config = cls.current().clone()
-        app_overrides: Dict[str, Any] = {
-            "element_wait": {"timeout": default_timeout, "interval": polling_interval},
-            "visibility_wait": {"timeout": default_timeout, "interval": polling_interval},
-            "enabled_wait": {"timeout": default_timeout, "interval": polling_interval},
-            "resolve_window": {"timeout": default_timeout, "interval": polling_interval},
-            "resolve_element": {"timeout": default_timeout, "interval": polling_interval},
-            "wait_for_any": {"timeout": default_timeout, "interval": polling_interval},
-            "exists_wait": {
-                "timeout": max(default_timeout / 5, polling_interval),
-                "interval": polling_interval,
-            },
-        }
-        _apply_overrides(config, app_overrides)
+        config._apply_overrides(_build_app_default_overrides(default_timeout, polling_interval))
         cls.install_run_config(config)
 
     
     @classmethod
     @contextmanager
     def override(cls, **kwargs: Any) -> Generator[TimeConfig, None, None]:
-        """Context manager for temporary configuration overrides."""
-        previous = getattr(cls._local, "override", None)
-        new_config = cls.current().clone()
-        _apply_overrides(new_config, kwargs)
+        """
+        Context manager for temporary configuration overrides.
+
+        Without kwargs the block just pins the current config, which is yielded
+        by reference rather than cloned; treat it as read-only.
+        """
+        new_config = cls.current()
+        if kwargs:
+            new_config = new_config.clone()
+            new_config._apply_overrides(kwargs)
         
-        cls._local.override = new_config
+        token = cls._override_var.set(new_config)
+        cls._effective_var.set(new_config)
         try:
             yield new_config
         finally:
-            cls._local.override = previous
+            cls._override_var.reset(token)
+            cls._refresh_effective()
     
     @classmethod
     def reset_to_defaults(cls) -> None:
@@ -258,28 +321,43 @@ class TimeConfig:
         with cls._lock:
             cls._default_preset = "default"
             cls._default_instance = cls(cls._default_preset)
-        cls._local.override = None
-        cls._local.run_config = None
-
-def _apply_overrides(config: TimeConfig, overrides: Dict[str, Any]) -> None:
-    for key, value in overrides.items():
-        if key in config._timeout_fields():
-            base_setting: TimeoutSettings = getattr(config, key)
-            if isinstance(value, TimeoutSettings):
-                setattr(config, key, deepcopy(value))
-            elif isinstance(value, dict):
-                new_setting = base_setting.with_overrides(
-                    timeout=value.get("timeout"),
-                    interval=value.get("interval"),
-                    retry_count=value.get("retry_count"),
-                )
-                setattr(config, key, new_setting)
-            else:
-                raise ValueError(f"Invalid override for {key}: {value}")
-        elif key in config._pause_fields():
-            setattr(config, key, float(value))
-        else:
-            raise ValueError(f"Unknown TimeConfig field: {key}")
+        cls._override_var.set(None)
+        cls._run_config_var.set(None)
+        cls._effective_var.set(None)
+
+
+
+def build_timeout_overrides(timeout: float) -> Mapping[str, Dict[str, float]]:
+    """
+    Build the read-only override mapping for a single base timeout (CLI --timeout).
+
+    Fields that share a value share one sub-dict, so the mapping can be passed
+    to every run in a bulk session without copying.
+    """
+    same = {"timeout": timeout}
+    overrides: Dict[str, Dict[str, float]] = dict.fromkeys(
+        ("element_wait", "visibility_wait", "resolve_window", "resolve_element", "wait_for_any"),
+        same,
+    )
+    overrides["window_wait"] = {"timeout": timeout * 2}
+    overrides["enabled_wait"] = {"timeout": timeout / 2}
+    overrides["exists_wait"] = {"timeout": max(timeout / 5, 0.1)}
+    return MappingProxyType(overrides)
+
+
+def _build_app_default_overrides(default_timeout: float, polling_interval: float) -> Dict[str, Dict[str, float]]:
+    """Override mapping for the app-level default_timeout/polling_interval from elements.yaml."""
+    same = {"timeout": default_timeout, "interval": polling_interval}
+    overrides: Dict[str, Dict[str, float]] = dict.fromkeys(
+        ("element_wait", "visibility_wait", "enabled_wait", "resolve_window", "resolve_element", "wait_for_any"),
+        same,
+    )
+    overrides["exists_wait"] = {
+        "timeout": max(default_timeout / 5, polling_interval),
+        "interval": polling_interval,
+    }
+    return overrides
+
 
 def configure_for_ci() -> None:
     """Configure timeouts optimized for CI/CD environments (run scope)."""
@@ -294,4 +372,5 @@ def configure_for_slow() -> None:
     TimeConfig.apply_preset("slow")
 
 def available_presets() -> Dict[str, Dict[str, Any]]:
-    return list_presets()
\ No newline at end of file
+    from .timings import list_presets
+    return list_presets()
@@ -5,24 +5,44 @@
 """
 
 from __future__ import annotations
+import inspect
+import itertools
+import os
 import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generator, List, Optional
-from uuid import uuid4
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
+from .actionlogger import ACTION_LOGGER
 
-@dataclass
+# Accepted "on" values for UIAUTO_* boolean environment flags (compared lowercased)
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+# Process-wide action ids; next() on itertools.count is atomic under the GIL.
+# Log events also carry the run_id, which tells runs/processes apart.
+_ACTION_IDS = itertools.count(1)
+
+
+@dataclass(slots=True)
 class ActionContext:
-    """Context information for a single action."""
-    action_id: str = field(default_factory=lambda: str(uuid4())[:8])
+    """Context information for a single action (slotted; one is created per tracked action)."""
     action_name: str = ""
     element_name: Optional[str] = None
     window_name: Optional[str] = None
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.monotonic)
     metadata: Dict[str, Any] = field(default_factory=dict)
     parent_context: Optional[ActionContext] = None
+    # Assigned on first read of action_id; most contexts are never logged
+    _action_id: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def action_id(self) -> str:
+        """Process-unique id for this action, allocated on first access."""
+        action_id = self._action_id
+        if action_id is None:
+            action_id = self._action_id = f"{next(_ACTION_IDS):08x}"
+        return action_id
     
     @property
     def description(self) -> str:
@@ -37,7 +57,7 @@ class ActionContext:
     @property
     def elapsed_time(self) -> float:
         """Time elapsed since action started."""
-        return time.time() - self.start_time
+        return time.monotonic() - self.start_time
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for logging/serialization."""
@@ -61,11 +81,11 @@ class ActionContext:
     
     def format_trace(self) -> str:
         """Format the full action trace for error messages."""
-        trace = self.get_full_trace()
-        lines = ["Action trace (most recent first):"]
-        for i, ctx in enumerate(trace):
-            prefix = "  -> " if i > 0 else "  X "
-            lines.append(f"{prefix}{ctx.description} [{ctx.elapsed_time:.2f}s]")
+        lines = ["Action trace (most recent first):", f"  X {self.description} [{self.elapsed_time:.2f}s]"]
+        ctx = self.parent_context
+        while ctx is not None:
+            lines.append(f"  -> {ctx.description} [{ctx.elapsed_time:.2f}s]")
+            ctx = ctx.parent_context
         return "\n".join(lines)
 
 
@@ -73,13 +93,26 @@ class ActionContextManager:
     """Thread-safe manager for action context stack."""
     
     _local = threading.local()
+    _enabled: bool = os.getenv("UIAUTO_ACTION_TRACKING", "1").lower() in _TRUTHY
+    
+    @classmethod
+    def enable(cls, enabled: bool = True) -> None:
+        """Enable or disable context tracking for @tracked_action methods."""
+        cls._enabled = bool(enabled)
+    
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Return True if @tracked_action methods record context."""
+        return cls._enabled
     
     @classmethod
     def _get_stack(cls) -> List[ActionContext]:
         """Get the context stack for the current thread."""
-        if not hasattr(cls._local, 'stack'):
-            cls._local.stack = []
-        return cls._local.stack
+        try:
+            return cls._local.stack
+        except AttributeError:
+            stack = cls._local.stack = []
+            return stack
     
     @classmethod
     def current(cls) -> Optional[ActionContext]:
@@ -108,20 +141,31 @@ class ActionContextManager:
         action_name: str,
         element_name: Optional[str] = None,
         window_name: Optional[str] = None,
+        start_time: Optional[float] = None,
         **metadata: Any
     ) -> Generator[ActionContext, None, None]:
-        """Context manager for tracking an action."""
+        """
+        Context manager for tracking an action.
+
+        @param start_time time.monotonic() reading to reuse as the context start
+        """
         context = ActionContext(
             action_name=action_name,
             element_name=element_name,
             window_name=window_name,
+            start_time=time.monotonic() if start_time is None else start_time,
             metadata=metadata
         )
-        cls.push(context)
+        # Same as push()/pop(), on one stack lookup for the whole block
+        stack = cls._get_stack()
+        if stack:
+            context.parent_context = stack[-1]
+        stack.append(context)
         try:
             yield context
         finally:
-            cls.pop()
+            if stack:
+                stack.pop()
     
     @classmethod
     def get_current_description(cls) -> str:
@@ -137,50 +181,88 @@ class ActionContextManager:
         cls._local.stack = []
 
 
+_ELEMENT_NAME_KEYS = ("element_name", "element", "name")
+
+
+def _element_name_keys(func: Any) -> Tuple[str, ...]:
+    """
+    Keyword arguments of func that can carry the element name, in lookup order.
+
+    Resolved once per decorated function so the wrapper only probes keywords the
+    function actually accepts.
+    """
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return _ELEMENT_NAME_KEYS
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+        return _ELEMENT_NAME_KEYS
+    return tuple(key for key in _ELEMENT_NAME_KEYS if key in params)
+
+
+def _log_action_finish(
+    name: str,
+    element_name: Optional[str],
+    status: str,
+    duration_ms: int,
+    kwargs: Dict[str, Any],
+    context: ActionContext,
+    exception: Optional[BaseException] = None,
+) -> None:
+    """Emit the action_finish event for a @tracked_action call."""
+    ACTION_LOGGER.log(
+        action=name,
+        element=element_name,
+        status=status,
+        duration_ms=duration_ms,
+        metadata=kwargs,
+        exception=exception,
+        # Only touch action_id when the event is actually emitted
+        action_id=context.action_id if ACTION_LOGGER.is_enabled() else None,
+        phase="execute",
+        event="action_finish",
+    )
+
+
 def tracked_action(action_name: Optional[str] = None):
     """Decorator to automatically track action context."""
     def decorator(func):
         name = action_name or func.__name__
+        element_keys = _element_name_keys(func)
         
         def wrapper(*args, **kwargs):
-            from .actionlogger import ACTION_LOGGER
+            if not ActionContextManager._enabled:
+                return func(*args, **kwargs)
 
-            element_name = kwargs.get('element_name') or kwargs.get('element') or kwargs.get('name')
+            element_name = None
+            for key in element_keys:
+                element_name = kwargs.get(key)
+                if element_name:
+                    break
             if element_name is None and len(args) > 1:
                 candidate = args[1]
                 if isinstance(candidate, str):
                     element_name = candidate
             
-            start_time = time.time()
-            with ActionContextManager.action(name, element_name=element_name) as context:
+            start_time = time.monotonic()
+            status: Optional[str] = None
+            error: Optional[BaseException] = None
+            with ActionContextManager.action(name, element_name=element_name, start_time=start_time) as context:
                 try:
                     result = func(*args, **kwargs)
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    ACTION_LOGGER.log(
-                        action=name,
-                        element=element_name,
-                        status="ok",
-                        duration_ms=duration_ms,
-                        metadata=kwargs,
-                        action_id=context.action_id,
-                        phase="execute",
-                        event="action_finish",
-                    )
+                    status = "ok"
                     return result
                 except Exception as exc:
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    ACTION_LOGGER.log(
-                        action=name,
-                        element=element_name,
-                        status="error",
-                        duration_ms=duration_ms,
-                        metadata=kwargs,
-                        exception=exc,
-                        action_id=context.action_id,
-                        phase="execute",
-                        event="action_finish",
-                    )
+                    status, error = "error", exc
                     raise
+                finally:
+                    # status stays None for BaseException (e.g. KeyboardInterrupt), which is not logged
+                    if status is not None:
+                        _log_action_finish(
+                            name, element_name, status,
+                            int((time.monotonic() - start_time) * 1000),
+                            kwargs, context, error,
+                        )
         
         wrapper.__name__ = func.__name__
         wrapper.__doc__ = func.__doc__
@@ -5,8 +5,14 @@
 """
 
 from __future__ import annotations
+import traceback
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _format_traceback(exc: BaseException) -> str:
+    """Full formatted traceback of exc, as traceback.format_exception renders it."""
+    return "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
 
 
 class UIAutoError(Exception):
@@ -42,6 +48,7 @@ class TimeoutError(UIAutoError):
         self.attempt_count: Optional[int] = None
         self.elapsed_time: Optional[float] = None
         self.stage: Optional[str] = None
+        self._traceback_cache: Optional[Tuple[BaseException, str]] = None
     
     def __str__(self) -> str:
         base_msg = super().__str__()
@@ -84,12 +91,15 @@ class TimeoutError(UIAutoError):
         if self.original_exception is None:
             return ""
         
-        import traceback
-        return "".join(traceback.format_exception(
-            type(self.original_exception),
-            self.original_exception,
-            self.original_exception.__traceback__
-        ))
+        # original_exception is assigned after construction, so the cache
+        # remembers which exception its text belongs to
+        cached = self._traceback_cache
+        if cached is None or cached[0] is not self.original_exception:
+            cached = self._traceback_cache = (
+                self.original_exception,
+                _format_traceback(self.original_exception),
+            )
+        return cached[1]
 
 
 @dataclass
@@ -100,6 +110,23 @@ class LocatorAttempt:
     error: Optional[str] = None
 
 
+def _format_not_found(
+    header: str,
+    last_error: Optional[str],
+    attempts: List[LocatorAttempt],
+    artifacts: Dict[str, str],
+) -> str:
+    """Multi-line message shared by WindowNotFoundError and ElementNotFoundError."""
+    lines = [header]
+    if last_error:
+        lines.append(f"Last error: {last_error}")
+    lines.append("Attempts:")
+    lines.extend(f"  {i}. {a.kind}: {a.locator} err={a.error}" for i, a in enumerate(attempts, start=1))
+    if artifacts:
+        lines.append(f"Artifacts: {artifacts}")
+    return "\n".join(lines)
+
+
 class WindowNotFoundError(UIAutoError):
     """
     Raised when a window cannot be found within the timeout period.
@@ -120,20 +147,13 @@ class WindowNotFoundError(UIAutoError):
         self.timeout = timeout
         self.last_error = last_error
         self.artifacts = artifacts or {}
-        super().__init__(self.__str__())
+        # Only the header is formatted here; __str__ renders the attempt list on
+        # demand, since resolve() raises this inside retry loops that swallow it
+        super().__init__(f"WindowNotFoundError: window='{window_name}' timeout={timeout}s")
 
     def __str__(self) -> str:
-        lines = [
-            f"WindowNotFoundError: window='{self.window_name}' timeout={self.timeout}s",
-        ]
-        if self.last_error:
-            lines.append(f"Last error: {self.last_error}")
-        lines.append("Attempts:")
-        for i, a in enumerate(self.attempts, start=1):
-            lines.append(f"  {i}. {a.kind}: {a.locator} err={a.error}")
-        if self.artifacts:
-            lines.append(f"Artifacts: {self.artifacts}")
-        return "\n".join(lines)
+        # args[0] is the header line built in __init__
+        return _format_not_found(self.args[0], self.last_error, self.attempts, self.artifacts)
 
 
 class ElementNotFoundError(UIAutoError):
@@ -159,21 +179,15 @@ class ElementNotFoundError(UIAutoError):
         self.timeout = timeout
         self.last_error = last_error
         self.artifacts = artifacts or {}
-        super().__init__(self.__str__())
+        # Header only; the attempt list is rendered lazily by __str__
+        super().__init__(
+            f"ElementNotFoundError: element='{element_name}' "
+            f"window='{window_name}' timeout={timeout}s"
+        )
 
     def __str__(self) -> str:
-        lines = [
-            f"ElementNotFoundError: element='{self.element_name}' "
-            f"window='{self.window_name}' timeout={self.timeout}s",
-        ]
-        if self.last_error:
-            lines.append(f"Last error: {self.last_error}")
-        lines.append("Attempts:")
-        for i, a in enumerate(self.attempts, start=1):
-            lines.append(f"  {i}. {a.kind}: {a.locator} err={a.error}")
-        if self.artifacts:
-            lines.append(f"Artifacts: {self.artifacts}")
-        return "\n".join(lines)
+        # args[0] is the header line built in __init__
+        return _format_not_found(self.args[0], self.last_error, self.attempts, self.artifacts)
 
 
 class ActionError(UIAutoError):
@@ -197,6 +211,7 @@ class ActionError(UIAutoError):
         self.details = details
         self.artifacts = artifacts or {}
         self.cause = cause
+        self._traceback_cache: Optional[Tuple[BaseException, str]] = None
         super().__init__(self.__str__())
 
     def __str__(self) -> str:
@@ -220,12 +235,10 @@ class ActionError(UIAutoError):
         if self.cause is None:
             return ""
         
-        import traceback
-        return "".join(traceback.format_exception(
-            type(self.cause),
-            self.cause,
-            self.cause.__traceback__
-        ))
+        cached = self._traceback_cache
+        if cached is None or cached[0] is not self.cause:
+            cached = self._traceback_cache = (self.cause, _format_traceback(self.cause))
+        return cached[1]
 
 
 class ElementNotVisibleError(UIAutoError):
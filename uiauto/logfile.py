@@ -0,0 +1,41 @@
+# uiauto/logfile.py
+"""
+@file logfile.py
+@brief Append-only log file writer shared by the action and timing loggers.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Optional
+
+
+def _make_parent_dir(path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)) or ".", exist_ok=True)
+
+
+class LogFileAppender:
+    """Thread-safe line appender that creates the log directory once per path."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._dir_ready_for: Optional[str] = None
+
+    def append(self, path: str, line: str) -> None:
+        """Append one line to path; OS errors are swallowed so logging never fails a run."""
+        with self._lock:
+            try:
+                if path != self._dir_ready_for:
+                    _make_parent_dir(path)
+                    self._dir_ready_for = path
+                try:
+                    f = open(path, "a", encoding="utf-8")
+                except FileNotFoundError:
+                    # Directory removed since it was created; recreate it and retry once
+                    _make_parent_dir(path)
+                    f = open(path, "a", encoding="utf-8")
+                with f:
+                    f.write(line + "\n")
+            except OSError:
+                self._dir_ready_for = None
@@ -11,7 +11,8 @@ import os
 import re
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -91,6 +92,19 @@ try:
     POINT = wintypes.POINT
     POINT_AVAILABLE = True
     
+    class GUITHREADINFO(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.DWORD),
+            ("flags", wintypes.DWORD),
+            ("hwndActive", wintypes.HWND),
+            ("hwndFocus", wintypes.HWND),
+            ("hwndCapture", wintypes.HWND),
+            ("hwndMenuOwner", wintypes.HWND),
+            ("hwndMoveSize", wintypes.HWND),
+            ("hwndCaret", wintypes.HWND),
+            ("rcCaret", wintypes.RECT),
+        ]
+    
     try:
         user32 = ctypes.windll.user32
         kernel32 = ctypes.windll.kernel32
@@ -143,6 +157,48 @@ try:
         VkKeyScanW.argtypes = [wintypes.WCHAR]
         VkKeyScanW.restype = ctypes.c_short
         
+        IsWindow = user32.IsWindow
+        IsWindow.argtypes = [wintypes.HWND]
+        IsWindow.restype = wintypes.BOOL
+        
+        IsWindowVisible = user32.IsWindowVisible
+        IsWindowVisible.argtypes = [wintypes.HWND]
+        IsWindowVisible.restype = wintypes.BOOL
+        
+        WindowFromPoint = user32.WindowFromPoint
+        WindowFromPoint.argtypes = [wintypes.POINT]
+        WindowFromPoint.restype = wintypes.HWND
+        
+        GetAncestor = user32.GetAncestor
+        GetAncestor.argtypes = [wintypes.HWND, ctypes.c_uint]
+        GetAncestor.restype = wintypes.HWND
+        
+        GetWindowThreadProcessId = user32.GetWindowThreadProcessId
+        GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+        GetWindowThreadProcessId.restype = wintypes.DWORD
+        
+        GetGUIThreadInfo = user32.GetGUIThreadInfo
+        GetGUIThreadInfo.argtypes = [wintypes.DWORD, ctypes.POINTER(GUITHREADINFO)]
+        GetGUIThreadInfo.restype = wintypes.BOOL
+        
+        MsgWaitForMultipleObjectsEx = user32.MsgWaitForMultipleObjectsEx
+        MsgWaitForMultipleObjectsEx.argtypes = [
+            wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE), wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+        ]
+        MsgWaitForMultipleObjectsEx.restype = wintypes.DWORD
+        
+        CreateEvent = kernel32.CreateEventW
+        CreateEvent.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+        CreateEvent.restype = wintypes.HANDLE
+        
+        SetEvent = kernel32.SetEvent
+        SetEvent.argtypes = [wintypes.HANDLE]
+        SetEvent.restype = wintypes.BOOL
+        
+        CloseHandle = kernel32.CloseHandle
+        CloseHandle.argtypes = [wintypes.HANDLE]
+        CloseHandle.restype = wintypes.BOOL
+        
         WINDOWS_API_AVAILABLE = True
     except (AttributeError, OSError):
         WINDOWS_API_AVAILABLE = False
@@ -157,10 +213,21 @@ try:
         PostQuitMessage = None
         SetProcessDPIAware = None
         VkKeyScanW = None
+        IsWindow = None
+        IsWindowVisible = None
+        WindowFromPoint = None
+        GetAncestor = None
+        GetWindowThreadProcessId = None
+        GetGUIThreadInfo = None
+        MsgWaitForMultipleObjectsEx = None
+        CreateEvent = None
+        SetEvent = None
+        CloseHandle = None
     
 except ImportError:
     POINT = None
     POINT_AVAILABLE = False
+    GUITHREADINFO = None
     WINDOWS_API_AVAILABLE = False
     RegisterHotKey = None
     UnregisterHotKey = None
@@ -173,13 +240,34 @@ except ImportError:
     PostQuitMessage = None
     SetProcessDPIAware = None
     VkKeyScanW = None
+    IsWindow = None
+    IsWindowVisible = None
+    WindowFromPoint = None
+    GetAncestor = None
+    GetWindowThreadProcessId = None
+    GetGUIThreadInfo = None
+    MsgWaitForMultipleObjectsEx = None
+    CreateEvent = None
+    SetEvent = None
+    CloseHandle = None
 
 # Constants for PeekMessage
 PM_REMOVE = 0x0001
 
+# Constants for MsgWaitForMultipleObjectsEx
+QS_ALLINPUT = 0x04FF
+MWMO_INPUTAVAILABLE = 0x0004
+WAIT_OBJECT_0 = 0x00000000
+WAIT_FAILED = 0xFFFFFFFF
+# Upper bound on one wait, so flag changes made without stop() are still noticed
+HOTKEY_WAIT_MS = 500
+
 # Constants for CreateWindowEx
 HWND_MESSAGE = -3
 
+# GetAncestor flag: top-level window containing the given one
+GA_ROOT = 2
+
 # Hotkey constants
 MOD_ALT = 0x0001
 MOD_CONTROL = 0x0002
@@ -280,6 +368,8 @@ class Recorder:
         self._last_action_time = 0.0
         self._typing_timeout = 2.0
         self._typing_lock = threading.Lock()
+        # Set by stop() under _typing_lock once steps are final; later worker output is dropped
+        self._steps_closed = False
         
         # Last clicked element for typing context
         self._last_clicked_element_info: Optional[Dict[str, Any]] = None
@@ -295,6 +385,14 @@ class Recorder:
         self._hotkey_thread: Optional[threading. Thread] = None
         self._flush_thread: Optional[threading.Thread] = None
         
+        # Listener callbacks only queue work; _event_worker runs it in arrival order
+        # so UIA capture never blocks the OS input hooks
+        self._event_q: Deque[Tuple[Callable[..., None], Tuple[Any, ...]]] = deque()
+        self._event_wake = threading.Event()
+        self._event_thread: Optional[threading.Thread] = None
+        # Reused by _is_point_in_other_process, which only runs on the event worker
+        self._scratch_point = POINT() if POINT_AVAILABLE else None
+        
         # Modifier keys state
         self._ctrl_pressed = False
         self._alt_pressed = False
@@ -305,6 +403,24 @@ class Recorder:
         self._stop_hotkey_pressed = False
         self._stop_hotkey_id = 1
         self._pending_stop_hotkey = False
+        # Win32 event the hotkey thread waits on next to its message queue; set by stop()
+        self._stop_event_handle = None
+        
+        # Stop hotkey matching, fixed for the session so the keyboard hook thread
+        # does one tuple compare / set lookup per key press
+        stop_key = STOP_HOTKEY_KEY.lower()
+        self._stop_hotkey_sig = (STOP_HOTKEY_CTRL, STOP_HOTKEY_ALT, STOP_HOTKEY_SHIFT, stop_key)
+        # Ctrl+Alt+Q arrives as "@" on layouts where AltGr+Q types it
+        self._stop_hotkey_variants = frozenset({stop_key, "@"} if stop_key == "q" else {stop_key})
+        stop_step_keys = []
+        if STOP_HOTKEY_CTRL:
+            stop_step_keys.append("^")
+        if STOP_HOTKEY_ALT:
+            stop_step_keys.append("%")
+        if STOP_HOTKEY_SHIFT:
+            stop_step_keys.append("+")
+        stop_step_keys.append(STOP_HOTKEY_KEY)
+        self._stop_hotkey_step_keys = frozenset({"".join(stop_step_keys), "^%@", "^%q", "^%Q"})
         
         # Desktop instance (cached)
         self._desktop:  Optional[Desktop] = None
@@ -328,13 +444,23 @@ class Recorder:
     def _get_target_window(self):
         """Get the target window matching window_title_re."""
         if self._target_window is not None:
-            try:
-                handle = _safe(lambda: self._target_window. handle)
-                if handle == self._target_window_handle:
-                    if _safe(lambda: self._target_window. is_visible(), False):
+            hwnd = self._target_window_handle
+            if hwnd and IsWindow and IsWindowVisible:
+                # Called for every click, keystroke and hover tick: validate the
+                # cached HWND with plain user32 calls instead of UIA round-trips
+                try:
+                    if IsWindow(hwnd) and IsWindowVisible(hwnd):
                         return self._target_window
-            except Exception:
-                pass
+                except Exception:
+                    pass
+            else:
+                try:
+                    handle = _safe(lambda: self._target_window. handle)
+                    if handle == self._target_window_handle:
+                        if _safe(lambda: self._target_window. is_visible(), False):
+                            return self._target_window
+                except Exception:
+                    pass
             self._target_window = None
             self._target_window_handle = None
         
@@ -402,6 +528,12 @@ class Recorder:
         self._pending_stop_hotkey = False
         self._stop_event. clear()
         
+        self._event_q.clear()
+        self._event_wake.clear()
+        self._steps_closed = False
+        self._event_thread = threading.Thread(target=self._event_worker, daemon=True)
+        self._event_thread.start()
+        
         if WINDOWS_API_AVAILABLE and RegisterHotKey: 
             self._hotkey_thread = threading.Thread(target=self._hotkey_listener_thread, daemon=True)
             self._hotkey_thread. start()
@@ -429,11 +561,29 @@ class Recorder:
         self._stopping = True
         self._recording = False
         self._stop_event.set()
+        stop_handle = self._stop_event_handle
+        if stop_handle and SetEvent:
+            try:
+                SetEvent(stop_handle)
+            except Exception:
+                pass
 
         self._hover_running = False
         self._overlay.stop()
         
-        self._flush_typing()
+        # Let events already queued by the listeners land before the final flush
+        worker = self._event_thread
+        if worker is not None and worker is not threading.current_thread():
+            self._event_wake.set()
+            worker.join(timeout=5.0)
+            if worker.is_alive():
+                # Stuck in a UIA call; whatever is still queued is dropped
+                self._event_q.clear()
+                _print("  ⚠️  Input worker did not finish in time; unprocessed events were dropped.")
+        
+        with self._typing_lock:
+            self._flush_typing_unsafe()
+            self._steps_closed = True
         self._remove_stop_hotkey_from_steps()
         
         if self._keyboard_listener:
@@ -460,26 +610,14 @@ class Recorder:
 
     def _remove_stop_hotkey_from_steps(self) -> None:
         """Remove any stop hotkey steps that were accidentally recorded."""
-        stop_hotkey_parts = []
-        if STOP_HOTKEY_CTRL: 
-            stop_hotkey_parts.append("^")
-        if STOP_HOTKEY_ALT:
-            stop_hotkey_parts.append("%")
-        if STOP_HOTKEY_SHIFT: 
-            stop_hotkey_parts.append("+")
-        stop_hotkey_parts.append(STOP_HOTKEY_KEY)
-        stop_hotkey_pattern = "".join(stop_hotkey_parts)
-        
-        alt_patterns = [stop_hotkey_pattern, "^%@", "^%q", "^%Q"]
-        
-        while self.steps:
-            last_step = self.steps[-1]
-            if "hotkey" in last_step:
-                keys = last_step["hotkey"].get("keys", "")
-                if keys in alt_patterns: 
-                    self.steps.pop()
-                    continue
-            break
+        stop_keys = self._stop_hotkey_step_keys
+        end = len(self.steps)
+        while end:
+            hotkey = self.steps[end - 1].get("hotkey")
+            if hotkey is None or hotkey.get("keys", "") not in stop_keys:
+                break
+            end -= 1
+        del self.steps[end:]
 
     def _fix_yaml_list_indent(self, yaml_str: str) -> str:
         """
@@ -680,8 +818,25 @@ class Recorder:
             if self.debug_json_out:
                 _print(f"  Debug: Native stop hotkey registered ({hotkey_str})")
             
+            wait_handles = None
+            if CreateEvent and MsgWaitForMultipleObjectsEx:
+                stop_handle = CreateEvent(None, True, False, None)
+                if stop_handle:
+                    self._stop_event_handle = stop_handle
+                    wait_handles = (wintypes.HANDLE * 1)(stop_handle)
+            
             msg = wintypes.MSG()
             while self._recording and not self._stop_event.is_set():
+                if wait_handles is not None:
+                    # Sleep until a message is queued or stop() signals the event
+                    rc = MsgWaitForMultipleObjectsEx(
+                        1, wait_handles, HOTKEY_WAIT_MS, QS_ALLINPUT, MWMO_INPUTAVAILABLE
+                    )
+                    if rc == WAIT_OBJECT_0:
+                        break
+                    if rc == WAIT_FAILED:
+                        wait_handles = None
+                
                 if PeekMessage(ctypes.byref(msg), hwnd, 0, 0, PM_REMOVE):
                     if msg.message == WM_HOTKEY and msg.wParam == self._stop_hotkey_id: 
                         self._stop_hotkey_pressed = True
@@ -694,7 +849,7 @@ class Recorder:
                     else:
                         TranslateMessage(ctypes.byref(msg))
                         DispatchMessage(ctypes.byref(msg))
-                else:
+                elif wait_handles is None:
                     time.sleep(0.01)
         
         except Exception as e:
@@ -714,6 +869,13 @@ class Recorder:
                         _print("  Debug:  Destroyed message window")
                 except Exception: 
                     pass
+            stop_handle = self._stop_event_handle
+            if stop_handle and CloseHandle:
+                self._stop_event_handle = None
+                try:
+                    CloseHandle(stop_handle)
+                except Exception:
+                    pass
 
     # =========================================================
     # Event Handlers
@@ -724,17 +886,23 @@ class Recorder:
         if not self._recording or not pressed or self._stopping or self._stop_requested:
             return
         
+        self._enqueue(self._record_click, x, y)
+
+    def _record_click(self, x: int, y: int) -> None:
+        """Capture the element under a click and record a click step (event worker)."""
         self._flush_typing()
         
         try:
-            time. sleep(0.05)
-            
             element_info = None
-            for attempt in range(3):
-                element_info = self._capture_element_at_point(x, y)
-                if element_info:
-                    break
+            # Clicks in other applications are rejected before any settle delay or UIA lookup
+            if not self._is_point_in_other_process(x, y):
                 time. sleep(0.05)
+                
+                for attempt in range(3):
+                    element_info = self._capture_element_at_point(x, y)
+                    if element_info or attempt == 2:
+                        break
+                    time. sleep(0.05)
             
             if not element_info: 
                 if self.debug_json_out: 
@@ -744,13 +912,16 @@ class Recorder:
                 self._overlay.error([x-20, y-20, x+20, y+20])
                 return
 
-            elem_key = self._ensure_element(element_info)
-            
-            self._last_clicked_element_info = element_info
-            self._last_clicked_element_key = elem_key
-            
-            self.steps.append({"click": {"element": elem_key}})
-            self._last_action_time = time.time()
+            with self._typing_lock:
+                if self._steps_closed:
+                    return
+                elem_key = self._ensure_element(element_info)
+                
+                self._last_clicked_element_info = element_info
+                self._last_clicked_element_key = elem_key
+                
+                self.steps.append({"click": {"element": elem_key}})
+                self._last_action_time = time.time()
             
             _print(f"  🖱️  Click: {elem_key}")
             rect = element_info.get("rect")
@@ -798,28 +969,59 @@ class Recorder:
                     self._pending_stop_hotkey = True
                     return
                 
+                # Formatted here: it reads the live modifier state
                 hotkey_str = self._format_hotkey(key)
                 if hotkey_str:
-                    self._flush_typing()
-                    self.steps.append({"hotkey": {"keys": hotkey_str}})
-                    self._last_action_time = time.time()
-                    _print(f"  ⌨️  Hotkey: {hotkey_str}")
+                    self._enqueue(self._record_hotkey, hotkey_str)
                     return
             
+            # The focused HWND is read here, at press time, so the worker can
+            # tell whether focus moved before it got to this key.
             # Handle special keys (backspace, enter, etc.)
             if key_name in SPECIAL_KEYS_MAP:
-                self._handle_special_key(key_name)
+                self._enqueue(self._handle_special_key, key_name, self._get_focus_hwnd())
                 return
             
             # Handle regular character input (including uppercase with Shift)
             char = self._get_char(key)
             if char:
-                self._handle_typing(char)
+                self._enqueue(self._handle_typing, char, self._get_focus_hwnd())
         
         except Exception as e:
             if self.debug_json_out:
                 _print(f"  Debug: Failed to capture key press: {type(e).__name__}: {e}")
 
+    def _record_hotkey(self, hotkey_str: str) -> None:
+        """Record a hotkey step (event worker)."""
+        with self._typing_lock:
+            if self._steps_closed:
+                return
+            self._flush_typing_unsafe()
+            self.steps.append({"hotkey": {"keys": hotkey_str}})
+            self._last_action_time = time.time()
+        _print(f"  ⌨️  Hotkey: {hotkey_str}")
+
+    def _enqueue(self, handler: Callable[..., None], *args: Any) -> None:
+        """Queue listener work for the event worker (called on the listener threads)."""
+        self._event_q.append((handler, args))
+        self._event_wake.set()
+
+    def _event_worker(self) -> None:
+        """Run queued listener events in arrival order until recording stops."""
+        queue = self._event_q
+        while True:
+            self._event_wake.wait(0.1)
+            self._event_wake.clear()
+            while queue:
+                handler, args = queue.popleft()
+                try:
+                    handler(*args)
+                except Exception as e:
+                    if self.debug_json_out:
+                        _print(f"  Debug: Failed to process input event: {type(e).__name__}: {e}")
+            if not self._recording and not queue:
+                break
+
     def _on_key_release(self, key) -> None:
         """Handle key release events (for modifier tracking)."""
         try:
@@ -849,32 +1051,20 @@ class Recorder:
 
     def _is_stop_hotkey(self, key_name: str) -> bool:
         """Check if current key press with modifiers matches stop hotkey."""
-        if STOP_HOTKEY_CTRL != self._ctrl_pressed:
-            return False
-        if STOP_HOTKEY_ALT != self._alt_pressed:
-            return False
-        if STOP_HOTKEY_SHIFT != self._shift_pressed:
-            return False
-        return key_name == STOP_HOTKEY_KEY. lower()
+        return (self._ctrl_pressed, self._alt_pressed, self._shift_pressed, key_name) == self._stop_hotkey_sig
 
     def _is_stop_hotkey_variant(self, key_name:  str) -> bool:
         """Check if current key could be a stop hotkey variant."""
-        if not (self._ctrl_pressed and self._alt_pressed):
-            return False
-        if key_name == STOP_HOTKEY_KEY.lower():
-            return True
-        if key_name == "@" and STOP_HOTKEY_KEY.lower() == "q":
-            return True
-        return False
+        return self._ctrl_pressed and self._alt_pressed and key_name in self._stop_hotkey_variants
 
     # =========================================================
     # Typing Handling
     # =========================================================
 
-    def _handle_typing(self, char: str) -> None:
+    def _handle_typing(self, char: str, focus_hwnd: int = 0) -> None:
         """Handle character typing (buffer for grouping)."""
         try:
-            element_info = self._capture_focused_element()
+            element_info = self._capture_focused_element(focus_hwnd)
             
             if not element_info and self._last_clicked_element_info:
                 element_info = self._last_clicked_element_info
@@ -886,13 +1076,14 @@ class Recorder:
                     _print(f"  Debug:  Typing '{char}' but could not identify focused element")
                 return
             
-            elem_key = self._ensure_element(element_info)
-
             rect = element_info.get("rect")
             if rect:
                 self._overlay.typing(rect)
 
             with self._typing_lock:
+                if self._steps_closed:
+                    return
+                elem_key = self._ensure_element(element_info)
                 if self._typing_element_key and self._typing_element_key != elem_key: 
                     self._flush_typing_unsafe()
                 
@@ -904,14 +1095,14 @@ class Recorder:
             if self.debug_json_out:
                 _print(f"  Debug:  Failed to capture typing:  {type(e).__name__}: {e}")
 
-    def _handle_special_key(self, key_name: str) -> None:
+    def _handle_special_key(self, key_name: str, focus_hwnd: int = 0) -> None:
         """Handle special keys like backspace, enter, etc."""
         try:
             special_key_str = SPECIAL_KEYS_MAP. get(key_name)
             if not special_key_str:
                 return
             
-            element_info = self._capture_focused_element()
+            element_info = self._capture_focused_element(focus_hwnd)
             if not element_info and self._last_clicked_element_info: 
                 element_info = self._last_clicked_element_info
             
@@ -920,13 +1111,14 @@ class Recorder:
                     _print(f"  Debug: Special key '{key_name}' but could not identify focused element")
                 return
             
-            elem_key = self._ensure_element(element_info)
-
             rect = element_info.get("rect")
             if rect:
                 self._overlay.typing(rect)
 
             with self._typing_lock:
+                if self._steps_closed:
+                    return
+                elem_key = self._ensure_element(element_info)
                 if self._typing_element_key == elem_key: 
                     self._typing_buffer.append(special_key_str)
                 else:
@@ -949,7 +1141,7 @@ class Recorder:
 
     def _flush_typing_unsafe(self) -> None:
         """Flush typing buffer without acquiring lock (must be called with lock held)."""
-        if not self._typing_buffer or not self._typing_element_key: 
+        if not self._typing_buffer or not self._typing_element_key or self._steps_closed: 
             return
         
         text = "".join(self._typing_buffer)
@@ -977,8 +1169,32 @@ class Recorder:
     # Element Capture & Management
     # =========================================================
 
-    def _capture_focused_element(self) -> Optional[Dict[str, Any]]: 
-        """Capture the currently focused UIA element."""
+    def _get_focus_hwnd(self) -> int:
+        """Return the HWND with keyboard focus on the foreground thread (0 if unknown)."""
+        if not GetGUIThreadInfo:
+            return 0
+        # Fresh struct per call: this runs on both the keyboard hook thread and the worker
+        info = GUITHREADINFO()
+        info.cbSize = ctypes.sizeof(GUITHREADINFO)
+        try:
+            if GetGUIThreadInfo(0, ctypes.byref(info)):
+                return info.hwndFocus or 0
+        except Exception:
+            pass
+        return 0
+
+    def _capture_focused_element(self, focus_hwnd: int = 0) -> Optional[Dict[str, Any]]: 
+        """
+        Capture the currently focused UIA element.
+
+        focus_hwnd is the focused HWND the listener saw when the key was pressed.
+        If focus has since moved to another HWND, the live UIA focus belongs to a
+        later event, so None is returned and callers use the last clicked element.
+        """
+        if focus_hwnd and focus_hwnd != self._get_focus_hwnd():
+            if self.debug_json_out:
+                _print("  Debug: Focus moved since key press; not using live focus")
+            return None
         try:
             target_window = self._get_target_window()
             if not target_window:
@@ -1011,6 +1227,33 @@ class Recorder:
                 _print(f"  Debug: Failed to capture focused element: {type(e).__name__}: {e}")
             return None
 
+    def _is_point_in_other_process(self, x: int, y: int) -> bool:
+        """
+        Check whether the top-level window under (x, y) belongs to a process other
+        than the target window's, using only user32 calls.
+
+        Windows of the target process (menus, dropdowns, dialogs) count as inside.
+        Returns False whenever this cannot be decided, leaving it to the UIA capture.
+        """
+        point = self._scratch_point
+        if point is None or not (WindowFromPoint and GetAncestor and GetWindowThreadProcessId):
+            return False
+        if self._get_target_window() is None or not self._target_window_handle:
+            return False
+        try:
+            point.x = x
+            point.y = y
+            root = GetAncestor(WindowFromPoint(point), GA_ROOT)
+            if not root or root == self._target_window_handle:
+                return False
+            root_pid = wintypes.DWORD()
+            target_pid = wintypes.DWORD()
+            GetWindowThreadProcessId(root, ctypes.byref(root_pid))
+            GetWindowThreadProcessId(self._target_window_handle, ctypes.byref(target_pid))
+            return bool(root_pid.value and target_pid.value) and root_pid.value != target_pid.value
+        except Exception:
+            return False
+
     def _capture_element_at_point(self, x: int, y:  int) -> Optional[Dict[str, Any]]:
         """Capture the UIA element at the specified screen coordinates."""
         try:
@@ -1,14 +1,19 @@
 # uiauto/repository.py
 from __future__ import annotations
 
+import copy
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import yaml
 
 from .exceptions import ConfigError
 
+# libyaml's C loader when PyYAML was built with it; same results, far faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 ALLOWED_LOCATOR_KEYS = {
     "auto_id",
     "name",
@@ -49,13 +54,44 @@ class Repository:
 
         self._validate()
 
+    @classmethod
+    def load(cls, path: str) -> Repository:
+        """
+        Load an object map, reusing the parsed instance while the file is unchanged.
+
+        Parsed instances are cached by (absolute path, mtime, size), so repeated
+        loads of the same elements.yaml in one process skip YAML parsing and
+        validation. Each call gets its own deep copy of the window/element maps,
+        so a caller mutating a spec never affects later loads.
+
+        An edit that keeps the file size and lands within the filesystem's
+        timestamp granularity (e.g. FAT's 2s) is not detected until the next
+        change; construct Repository(path) directly to force a fresh parse.
+        """
+        abs_path = os.path.abspath(path)
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            return cls(abs_path)
+        return _load_cached(cls, abs_path, st.st_mtime_ns, st.st_size)._copy()
+
+    def _copy(self) -> Repository:
+        """Return an instance sharing the validated config but owning its spec maps."""
+        clone = self.__class__.__new__(self.__class__)
+        clone.path = self.path
+        clone._raw = copy.deepcopy(self._raw)
+        clone._app = self._app
+        clone._windows = clone._raw.get("windows", {}) or {}
+        clone._elements = clone._raw.get("elements", {}) or {}
+        return clone
+
     @staticmethod
     def _load_yaml(path: str) -> Dict[str, Any]:
         if not os.path.exists(path):
             raise ConfigError(f"Object map YAML not found: {path}")
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            with open(path, "rb") as f:
+                data = yaml.load(f, Loader=_YAML_LOADER)
             if not isinstance(data, dict):
                 raise ConfigError("Object map YAML must be a mapping at root.")
             return data
@@ -135,3 +171,13 @@ class Repository:
 
     def list_elements(self) -> List[str]:
         return sorted(self._elements.keys())
+
+    def iter_element_specs(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (name, spec) pairs in list_elements() order without per-name lookups."""
+        # Names are unique, so sorting the pairs never falls through to comparing specs
+        return iter(sorted(self._elements.items()))
+
+
+@lru_cache(maxsize=8)
+def _load_cached(cls: type, path: str, mtime_ns: int, size: int) -> Repository:
+    return cls(path)
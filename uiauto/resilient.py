@@ -11,7 +11,8 @@ timing problems.
 from __future__ import annotations
 
 import time
-from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, FrozenSet, Optional, TypeVar
 
 from .config import TimeConfig
 from .context import ActionContextManager
@@ -19,13 +20,61 @@ from .element_meta import ElementMeta
 from .exceptions import (ActionError, ElementNotEnabledError,
                         ElementNotFoundError, ElementNotVisibleError,
                         StaleElementError, TimeoutError, UIAutoError)
-from .waits import retry, wait_until, wait_until_passes
+from .waits import retry, wait_until, wait_until_not, wait_until_passes
 
 if TYPE_CHECKING:
     from .resolver import Resolver
 
 T = TypeVar("T")
 
+# state -> (TimeConfig wait field, predicate, description) used by ResilientElement.wait.
+# is_visible()/is_enabled() already report False for a vanished element, so no
+# state needs a separate exists() round-trip per poll. "enabled" asks is_enabled()
+# first: an element that is shown but still disabled then costs one call per poll.
+_WAIT_STATES = {
+    "exists": ("element_wait", lambda el: el.exists(), "to exist"),
+    "visible": ("visibility_wait", lambda el: el.is_visible(), "to be visible"),
+    "enabled": ("enabled_wait", lambda el: el.is_enabled() and el.is_visible(), "to be enabled"),
+}
+
+
+@lru_cache(maxsize=64)
+def _class_attributes(handle_type: type) -> Optional[FrozenSet[str]]:
+    """
+    Attribute names defined on a raw element class, or None when the class
+    resolves attributes dynamically (__getattr__) and must be probed per instance.
+    """
+    if getattr(handle_type, "__getattr__", None) is not None:
+        return None
+    return frozenset(dir(handle_type))
+
+
+def _handle_has(handle: Any, name: str) -> bool:
+    """
+    hasattr() for the raw element capability checks.
+
+    Only the hit path is cached: a method defined on the handle's class is
+    answered from a per-class name set without touching the instance. Misses,
+    and classes with __getattr__ (e.g. pywinauto's WindowSpecification), still
+    fall back to hasattr().
+
+    @param handle Raw element wrapper
+    @param name Method name to look for
+    @return True if the handle provides name
+    """
+    names = _class_attributes(type(handle))
+    if names is not None and name in names:
+        return True
+    return hasattr(handle, name)
+
+
+# Actions whose preconditions are visibility only, or visibility plus enabled state
+_NEEDS_VISIBLE = frozenset({"hover", "get_text", "select_item"})
+_NEEDS_ENABLED = frozenset({"click", "double_click", "right_click", "set_text", "check", "uncheck", "select"})
+
+# First sleep of a state wait; later polls back off towards the configured interval
+_WAIT_BACKOFF_START = 0.01
+
 
 class ResilientElement:
     """
@@ -94,7 +143,7 @@ class ResilientElement:
     def _is_stale(self) -> bool:
         """Check if the element reference is stale."""
         try:
-            if hasattr(self._raw_element, 'exists'):
+            if _handle_has(self._raw_element, 'exists'):
                 return not self._raw_element.exists()
             return False
         except Exception:
@@ -188,13 +237,12 @@ class ResilientElement:
         """Prepare element for an action using centralized precondition ownership."""
         self._ensure_fresh()
 
-        needs_visible = {"hover", "get_text", "select_item"}
-        needs_enabled = {"click", "double_click", "right_click", "set_text", "check", "uncheck", "select"}
+        needs_enabled = action_name in _NEEDS_ENABLED
 
-        if self._auto_wait_visible or action_name in needs_visible or action_name in needs_enabled:
+        if self._auto_wait_visible or needs_enabled or action_name in _NEEDS_VISIBLE:
             self._ensure_visible()
 
-        if self._auto_wait_enabled or action_name in needs_enabled:
+        if self._auto_wait_enabled or needs_enabled:
             self._ensure_enabled()
     
     def _execute_with_retry(
@@ -243,7 +291,7 @@ class ResilientElement:
     def exists(self) -> bool:
         """Check if the element currently exists."""
         try:
-            if hasattr(self._raw_element, 'exists'):
+            if _handle_has(self._raw_element, 'exists'):
                 return bool(self._raw_element.exists())
             return True
         except Exception:
@@ -252,7 +300,7 @@ class ResilientElement:
     def is_visible(self) -> bool:
         """Check if the element is currently visible."""
         try:
-            if hasattr(self._raw_element, 'is_visible'):
+            if _handle_has(self._raw_element, 'is_visible'):
                 return bool(self._raw_element.is_visible())
             return True
         except Exception:
@@ -261,7 +309,7 @@ class ResilientElement:
     def is_enabled(self) -> bool:
         """Check if the element is currently enabled."""
         try:
-            if hasattr(self._raw_element, 'is_enabled'):
+            if _handle_has(self._raw_element, 'is_enabled'):
                 return bool(self._raw_element.is_enabled())
             return True
         except Exception:
@@ -277,44 +325,20 @@ class ResilientElement:
         @param timeout Override timeout
         @return self for chaining
         """
-        if state == "exists":
-            config = TimeConfig.current().element_wait
-        elif state == "visible":
-            config = TimeConfig.current().visibility_wait
-        elif state == "enabled":
-            config = TimeConfig.current().enabled_wait
-        else:
-            raise ValueError(f"Unknown state: {state}. Use 'exists', 'visible', or 'enabled'")
+        try:
+            config_field, predicate, description = _WAIT_STATES[state]
+        except KeyError:
+            raise ValueError(f"Unknown state: {state}. Use 'exists', 'visible', or 'enabled'") from None
 
-        effective_timeout = timeout if timeout is not None else config.timeout
-        effective_interval = config.interval
-        
-        if state == "exists":
-            wait_until(
-                self.exists,
-                timeout=effective_timeout,
-                interval=effective_interval,
-                description=f"element '{self._element_name}' to exist",
-                stage="precondition"
-            )
-        elif state == "visible":
-            wait_until(
-                lambda: self.exists() and self.is_visible(),
-                timeout=effective_timeout,
-                interval=effective_interval,
-                description=f"element '{self._element_name}' to be visible",
-                stage="precondition"
-            )
-        elif state == "enabled":
-            wait_until(
-                lambda: self.exists() and self.is_visible() and self.is_enabled(),
-                timeout=effective_timeout,
-                interval=effective_interval,
-                description=f"element '{self._element_name}' to be enabled",
-                stage="precondition"
-            )
-        else:
-            raise ValueError(f"Unknown state: {state}. Use 'exists', 'visible', or 'enabled'")
+        config = getattr(TimeConfig.current(), config_field)
+        wait_until(
+            lambda: predicate(self),
+            timeout=timeout if timeout is not None else config.timeout,
+            interval=config.interval,
+            description=f"element '{self._element_name}' {description}",
+            stage="precondition",
+            backoff_start=_WAIT_BACKOFF_START,
+        )
         
         return self
     
@@ -328,8 +352,6 @@ class ResilientElement:
     
     def wait_until_gone(self, timeout: Optional[float] = None) -> None:
         """Wait for the element to disappear."""
-        from .waits import wait_until_not
-        
         config = TimeConfig.current().disappear_wait
         effective_timeout = timeout if timeout is not None else config.timeout
         
@@ -338,7 +360,8 @@ class ResilientElement:
             timeout=effective_timeout,
             interval=config.interval,
             description=f"element '{self._element_name}' to disappear",
-            stage="precondition"
+            stage="precondition",
+            backoff_start=_WAIT_BACKOFF_START,
         )
     
     # --- Actions ---
@@ -348,9 +371,9 @@ class ResilientElement:
         self._prepare_for_action("click")
         
         def do_click():
-            if hasattr(self._raw_element, 'click_input'):
+            if _handle_has(self._raw_element, 'click_input'):
                 self._raw_element.click_input()
-            elif hasattr(self._raw_element, 'click'):
+            elif _handle_has(self._raw_element, 'click'):
                 self._raw_element.click()
             else:
                 raise ActionError("click", self._element_name, "Click not supported")
@@ -363,9 +386,9 @@ class ResilientElement:
         self._prepare_for_action("double_click")
         
         def do_double_click():
-            if hasattr(self._raw_element, 'double_click_input'):
+            if _handle_has(self._raw_element, 'double_click_input'):
                 self._raw_element.double_click_input()
-            elif hasattr(self._raw_element, 'double_click'):
+            elif _handle_has(self._raw_element, 'double_click'):
                 self._raw_element.double_click()
             else:
                 self._raw_element.click_input()
@@ -380,9 +403,9 @@ class ResilientElement:
         self._prepare_for_action("right_click")
         
         def do_right_click():
-            if hasattr(self._raw_element, 'right_click_input'):
+            if _handle_has(self._raw_element, 'right_click_input'):
                 self._raw_element.right_click_input()
-            elif hasattr(self._raw_element, 'click_input'):
+            elif _handle_has(self._raw_element, 'click_input'):
                 self._raw_element.click_input(button='right')
             else:
                 raise ActionError("right_click", self._element_name, "Right-click not supported")
@@ -395,9 +418,9 @@ class ResilientElement:
         self._prepare_for_action("hover")
         
         def do_hover():
-            if hasattr(self._raw_element, 'move_mouse_input'):
+            if _handle_has(self._raw_element, 'move_mouse_input'):
                 self._raw_element.move_mouse_input()
-            elif hasattr(self._raw_element, 'set_focus'):
+            elif _handle_has(self._raw_element, 'set_focus'):
                 self._raw_element.set_focus()
             else:
                 raise ActionError("hover", self._element_name, "Hover not supported")
@@ -410,9 +433,9 @@ class ResilientElement:
         self._prepare_for_action("set_text")
         
         def do_set_text():
-            if hasattr(self._raw_element, 'set_edit_text'):
+            if _handle_has(self._raw_element, 'set_edit_text'):
                 self._raw_element.set_edit_text(text)
-            elif hasattr(self._raw_element, 'type_keys'):
+            elif _handle_has(self._raw_element, 'type_keys'):
                 if clear_first:
                     self._raw_element.type_keys('^a{DELETE}', with_spaces=True)
                 self._raw_element.type_keys(text, with_spaces=True, with_tabs=True)
@@ -422,17 +445,33 @@ class ResilientElement:
         self._execute_with_retry(do_set_text, "set_text")
         return self
     
+    def replace_text(self, text: str) -> ResilientElement:
+        """Replace the element's text in a single UIA call where possible."""
+        self._prepare_for_action("set_text")
+        
+        def do_replace_text():
+            if _handle_has(self._raw_element, 'set_edit_text'):
+                # ValuePattern.SetValue replaces the whole value in one call
+                self._raw_element.set_edit_text(text)
+            elif _handle_has(self._raw_element, 'type_keys'):
+                self._raw_element.type_keys('^a{DELETE}' + text, with_spaces=True, with_tabs=True)
+            else:
+                raise ActionError("set_text", self._element_name, "Text input not supported")
+        
+        self._execute_with_retry(do_replace_text, "set_text")
+        return self
+    
     def get_text(self) -> str:
         """Get the text content of the element."""
         self._prepare_for_action("get_text")
         
         def do_get_text() -> str:
-            if hasattr(self._raw_element, 'window_text'):
+            if _handle_has(self._raw_element, 'window_text'):
                 return self._raw_element.window_text() or ""
-            elif hasattr(self._raw_element, 'texts'):
+            elif _handle_has(self._raw_element, 'texts'):
                 texts = self._raw_element.texts()
                 return texts[0] if texts else ""
-            elif hasattr(self._raw_element, 'get_value'):
+            elif _handle_has(self._raw_element, 'get_value'):
                 return str(self._raw_element.get_value() or "")
             return ""
         
@@ -443,9 +482,9 @@ class ResilientElement:
         self._prepare_for_action("check")
         
         def do_check():
-            if hasattr(self._raw_element, 'check'):
+            if _handle_has(self._raw_element, 'check'):
                 self._raw_element.check()
-            elif hasattr(self._raw_element, 'toggle'):
+            elif _handle_has(self._raw_element, 'toggle'):
                 state = self._raw_element.get_toggle_state()
                 if state != 1:
                     self._raw_element.toggle()
@@ -460,9 +499,9 @@ class ResilientElement:
         self._prepare_for_action("uncheck")
         
         def do_uncheck():
-            if hasattr(self._raw_element, 'uncheck'):
+            if _handle_has(self._raw_element, 'uncheck'):
                 self._raw_element.uncheck()
-            elif hasattr(self._raw_element, 'toggle'):
+            elif _handle_has(self._raw_element, 'toggle'):
                 state = self._raw_element.get_toggle_state()
                 if state == 1:
                     self._raw_element.toggle()
@@ -476,7 +515,7 @@ class ResilientElement:
     def get_state(self) -> str:
         """Get the toggle state of a checkbox."""
         try:
-            if hasattr(self._raw_element, 'get_toggle_state'):
+            if _handle_has(self._raw_element, 'get_toggle_state'):
                 state = self._raw_element.get_toggle_state()
                 if state == 1:
                     return "checked"
@@ -494,12 +533,12 @@ class ResilientElement:
         
         def do_select():
             if by_index:
-                if hasattr(self._raw_element, 'select'):
+                if _handle_has(self._raw_element, 'select'):
                     self._raw_element.select(int(option))
                 else:
                     raise ActionError("select", self._element_name, "Index selection not supported")
             else:
-                if hasattr(self._raw_element, 'select'):
+                if _handle_has(self._raw_element, 'select'):
                     self._raw_element.select(str(option))
                 else:
                     raise ActionError("select", self._element_name, "Text selection not supported")
@@ -517,12 +556,12 @@ class ResilientElement:
         
         def do_select_item():
             if item_text is not None:
-                if hasattr(self._raw_element, 'select'):
+                if _handle_has(self._raw_element, 'select'):
                     self._raw_element.select(item_text)
                 else:
                     raise ActionError("select_item", self._element_name, "Item selection not supported")
             elif item_index is not None:
-                if hasattr(self._raw_element, 'select'):
+                if _handle_has(self._raw_element, 'select'):
                     self._raw_element.select(item_index)
                 else:
                     raise ActionError("select_item", self._element_name, "Index selection not supported")
@@ -535,9 +574,9 @@ class ResilientElement:
     def item_count(self) -> int:
         """Get the number of items in a list/combobox."""
         try:
-            if hasattr(self._raw_element, 'item_count'):
+            if _handle_has(self._raw_element, 'item_count'):
                 return self._raw_element.item_count()
-            elif hasattr(self._raw_element, 'items'):
+            elif _handle_has(self._raw_element, 'items'):
                 return len(self._raw_element.items() or [])
             return 0
         except Exception:
@@ -89,12 +89,18 @@ class Resolver:
         """Clear the element cache."""
         self._element_cache.clear()
 
-    def resolve_window(self, window_name: str, timeout: Optional[float] = None) -> Any:
+    def resolve_window(
+        self,
+        window_name: str,
+        timeout: Optional[float] = None,
+        capture_artifacts: bool = True,
+    ) -> Any:
         """
         Resolve a window by name.
         
         @param window_name Logical window name from configuration
         @param timeout Override timeout (uses default if None)
+        @param capture_artifacts Capture screenshot/tree artifacts on failure
         @return Window wrapper object
         @throws WindowNotFoundError if window not found within timeout
         """
@@ -141,17 +147,18 @@ class Resolver:
 
         # Artifacts: try best guess window from Desktop by broad regex if provided
         artifacts = {}
-        try:
-            title_re = None
-            for loc in locators:
-                if "title_re" in loc:
-                    title_re = loc["title_re"]
-                    break
-            if title_re:
-                w = self.session.desktop_window(title_re=title_re)
-                artifacts = make_artifacts(w, self.repo.app.artifacts_dir, f"window_{window_name}")
-        except Exception:
-            pass
+        if capture_artifacts:
+            try:
+                title_re = None
+                for loc in locators:
+                    if "title_re" in loc:
+                        title_re = loc["title_re"]
+                        break
+                if title_re:
+                    w = self.session.desktop_window(title_re=title_re)
+                    artifacts = make_artifacts(w, self.repo.app.artifacts_dir, f"window_{window_name}")
+            except Exception:
+                pass
 
         raise WindowNotFoundError(
             window_name,
@@ -167,6 +174,7 @@ class Resolver:
         overrides: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = None,
         use_cache: bool = True,
+        capture_artifacts: bool = True,
     ) -> ResilientElement:
         """
         Resolve an element by name.
@@ -175,6 +183,7 @@ class Resolver:
         @param overrides Optional locator overrides (highest priority)
         @param timeout Override timeout (uses default if None)
         @param use_cache Whether to use cached element if available
+        @param capture_artifacts Capture screenshot/tree artifacts on failure
         @return ResilientElement wrapper object
         @throws ElementNotFoundError if element not found within timeout
         """
@@ -200,7 +209,7 @@ class Resolver:
             del self._element_cache[cache_key]
         
         with ActionContextManager.action("resolve", element_name=element_name, window_name=window_name):
-            window = self.resolve_window(window_name)
+            window = self.resolve_window(window_name, capture_artifacts=capture_artifacts)
 
             locators = list(espec.get("locators", []))
             if overrides:
@@ -242,10 +251,11 @@ class Resolver:
                     attempts.append(LocatorAttempt(kind="element", locator=locator, error=last_error))
 
             artifacts = {}
-            try:
-                artifacts = make_artifacts(window, self.repo.app.artifacts_dir, f"element_{element_name}")
-            except Exception:
-                pass
+            if capture_artifacts:
+                try:
+                    artifacts = make_artifacts(window, self.repo.app.artifacts_dir, f"element_{element_name}")
+                except Exception:
+                    pass
 
             raise ElementNotFoundError(
                 element_name=element_name,
@@ -271,7 +281,14 @@ class Resolver:
         @return True if element exists, False otherwise
         """
         try:
-            elem = self.resolve(element_name, overrides=overrides, timeout=max(timeout, 0.5), use_cache=False)
+            # A miss is an expected answer here, not a failure worth screenshots
+            elem = self.resolve(
+                element_name,
+                overrides=overrides,
+                timeout=max(timeout, 0.5),
+                use_cache=False,
+                capture_artifacts=False,
+            )
             return elem.exists()
         except (ElementNotFoundError, WindowNotFoundError):
             return False
@@ -10,6 +10,7 @@ import json
 import os
 import re
 import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
@@ -20,7 +21,7 @@ from .actions import Actions
 from .config import TimeConfig
 from .context import ActionContextManager
 from .exceptions import UIAutoError
-from .repository import Repository
+from .repository import _YAML_LOADER, Repository
 from .resolver import Resolver
 from .session import Session
 
@@ -45,6 +46,18 @@ def _substitute(value: Any, variables: Dict[str, Any]) -> Any:
     return value
 
 
+@lru_cache(maxsize=4)
+def _load_schema_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=4)
+def _compiled_validator(path: str, mtime_ns: int, size: int) -> Draft202012Validator:
+    # Validators only read the schema, so Runners (and their threads) share one
+    return Draft202012Validator(_load_schema_cached(path, mtime_ns, size))
+
+
 class Runner:
     """
     Loads scenario.yaml, validates, runs steps, emits report JSON.
@@ -57,24 +70,21 @@ class Runner:
         """
         self.repo = repo
         self.schema_path = os.path.abspath(schema_path)
-        self._schema = self._load_schema(self.schema_path)
-        self._validator = Draft202012Validator(self._schema)
+        # Schema and validator are built once per schema file while it is unchanged
+        st = os.stat(self.schema_path)
+        cache_key = (self.schema_path, st.st_mtime_ns, st.st_size)
+        self._schema = _load_schema_cached(*cache_key)
+        self._validator = _compiled_validator(*cache_key)
 
     @staticmethod
     def _load_yaml(path: str) -> Dict[str, Any]:
         """Load and parse YAML file."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
         if not isinstance(data, dict):
             raise ValueError("Scenario must be a mapping at root")
         return data
 
-    @staticmethod
-    def _load_schema(path: str) -> Dict[str, Any]:
-        """Load JSON schema file."""
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-
     def validate(self, scenario: Dict[str, Any]) -> None:
         """Validate scenario against JSON schema."""
         errors = sorted(self._validator.iter_errors(scenario), key=lambda e: e.path)
@@ -256,7 +266,7 @@ class Runner:
             return
 
         if keyword == "hotkey":
-            actions.hotkey(args["keys"])
+            actions.hotkey(args["keys"], pause=args.get("pause"))
             return
 
         if keyword == "type":
@@ -319,9 +329,20 @@ class Runner:
             return
 
         if keyword == "assert_text_contains":
+            # Only an explicit timeout polls; without one a mismatch fails at once
+            if "timeout" in args:
+                actions.assert_text_contains_eventually(
+                    args["element"],
+                    substring=args["substring"],
+                    timeout=args.get("timeout"),
+                    case_insensitive=bool(args.get("case_insensitive", False)),
+                    overrides=args.get("overrides")
+                )
+                return
             actions.assert_text_contains(
                 args["element"],
                 substring=args["substring"],
+                case_insensitive=bool(args.get("case_insensitive", False)),
                 overrides=args.get("overrides")
             )
             return
@@ -6,11 +6,12 @@
 
 from __future__ import annotations
 
-import os
 import threading
 import time
 from typing import Any, Dict, Optional
 
+from .logfile import LogFileAppender
+
 
 class TimingLogger:
     """Thread-safe timing logger with console/file output."""
@@ -20,6 +21,7 @@ class TimingLogger:
         self._enabled = False
         self._console = True
         self._file_path: Optional[str] = None
+        self._log_file = LogFileAppender()
         self._level = "INFO"
 
     def configure(
@@ -84,12 +86,9 @@ class TimingLogger:
             self._write_file(line)
 
     def _write_file(self, line: str) -> None:
-        try:
-            os.makedirs(os.path.dirname(os.path.abspath(self._file_path)) or ".", exist_ok=True)
-            with open(self._file_path, "a", encoding="utf-8") as f:
-                f.write(line + "\n")
-        except OSError:
-            pass
+        path = self._file_path
+        if path:
+            self._log_file.append(path, line)
 
 
 TIMING_LOGGER = TimingLogger()
\ No newline at end of file
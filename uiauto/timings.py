@@ -5,7 +5,6 @@
 """
 
 from __future__ import annotations
-from copy import deepcopy
 from typing import Any, Dict
 
 
@@ -139,9 +138,10 @@ def list_presets() -> Dict[str, Dict[str, Any]]:
 
 def build_preset_values(preset: str) -> Dict[str, Any]:
     preset_key = (preset or "default").lower()
-    values: Dict[str, Any] = {}
-    values.update(deepcopy(TIMEOUT_FIELDS))
-    values.update(deepcopy(PAUSE_FIELDS))
+    # Timeout entries are flat dicts of scalars and pauses are floats, so a
+    # one-level copy is enough to keep the module tables untouched
+    values: Dict[str, Any] = {name: dict(setting) for name, setting in TIMEOUT_FIELDS.items()}
+    values.update(PAUSE_FIELDS)
 
     if preset_key == "default":
         return values
@@ -156,14 +156,14 @@ def build_preset_values(preset: str) -> Dict[str, Any]:
         if key == "action_timeout":
             for timeout_key in values.keys():
                 if timeout_key.endswith("_action"):
-                    base = deepcopy(values[timeout_key])
+                    base = dict(values[timeout_key])
                     base.update(value)
                     values[timeout_key] = base
             continue
 
         # 🔹 Normal TIMEOUT_FIELDS override
         if key in TIMEOUT_FIELDS:
-            base = deepcopy(values[key])
+            base = dict(values[key])
             base.update(value)
             values[key] = base
         else:
@@ -16,10 +16,13 @@ TIMING_LOGGER = TimingLogger()
 
 T = TypeVar("T")
 
+# Sleep growth factor per attempt for waits started with backoff_start
+_BACKOFF_GROWTH = 1.5
 
-def _now() -> float:
-    """Monotonic time source for deterministic timeout calculations."""
-    return time.monotonic()
+
+# Monotonic time source for deterministic timeout calculations. Bound directly
+# (not wrapped in a function) since every poll reads it at least once.
+_now: Callable[[], float] = time.monotonic
 
 def _set_timeout_metadata(
     error: TimeoutError,
@@ -63,12 +66,18 @@ def wait_until(
     interval: float = 0.2,
     description: str = "condition",
     stage: Optional[str] = None,
+    backoff_start: Optional[float] = None,
 ) -> T:
     """
     Repeatedly runs predicate until it returns a truthy value,
     or until timeout.
+
+    With backoff_start, the first sleep is backoff_start and each later one grows
+    by _BACKOFF_GROWTH up to interval, so conditions that become true shortly
+    after the first check are noticed without waiting a full interval.
     """
     start_time = _now()
+    step = interval if backoff_start is None else min(backoff_start, interval)
     last_exception: Optional[BaseException] = None
     attempt_count = 0
 
@@ -106,9 +115,11 @@ def wait_until(
             last_exception = e
         
         time_left = timeout - elapsed
-        sleep_time = min(interval, time_left) if time_left > 0 else 0
+        sleep_time = min(step, time_left) if time_left > 0 else 0
         if sleep_time > 0:
             time.sleep(sleep_time)
+        if step < interval:
+            step = min(step * _BACKOFF_GROWTH, interval)
 
     elapsed = _now() - start_time
     if TIMING_LOGGER.is_enabled():
@@ -242,11 +253,15 @@ def wait_until_not(
     interval: float = 0.2,
     description: str = "condition to become false",
     stage: Optional[str] = None,
+    backoff_start: Optional[float] = None,
 ) -> None:
     """
     Wait until predicate returns a falsy value.
+
+    backoff_start works as in wait_until.
     """
     start_time = _now()
+    step = interval if backoff_start is None else min(backoff_start, interval)
     attempt_count = 0
 
     if TIMING_LOGGER.is_enabled():
@@ -283,9 +298,11 @@ def wait_until_not(
             return
         
         time_left = timeout - elapsed
-        sleep_time = min(interval, time_left) if time_left > 0 else 0
+        sleep_time = min(step, time_left) if time_left > 0 else 0
         if sleep_time > 0:
             time.sleep(sleep_time)
+        if step < interval:
+            step = min(step * _BACKOFF_GROWTH, interval)
 
     elapsed = _now() - start_time
     if TIMING_LOGGER.is_enabled():